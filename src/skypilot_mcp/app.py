@@ -5,181 +5,126 @@ creating a circular dependency (server.py imports tools, tools import mcp).
 """
 
 import asyncio
-
-import sky
+import importlib
+import importlib.resources
+import os
+import pathlib
+import sys
+import time
+from typing import Any
+
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server.lifespan import lifespan
 
+# A successful startup probe is remembered on disk for this many seconds, so
+# clients that spawn a fresh stdio server per connection don't pay an API
+# round-trip on every start.
+_API_INFO_CACHE_TTL = 60
+
 
 @lifespan
 async def skypilot_lifespan(server):
-    """Verify SkyPilot API server connectivity at startup."""
+    """Verify SkyPilot API server connectivity at startup.
+
+    The probe runs as a background task so the MCP handshake is not held
+    up by the SDK import and API round-trip. The task is exposed as
+    ``api_probe`` in the lifespan context.
+    """
+    probe = asyncio.create_task(_probe_api_server())
+    try:
+        yield {"api_probe": probe}
+    finally:
+        probe.cancel()
+
+
+async def _probe_api_server() -> None:
     try:
-        # Run the blocking SDK call in a thread to avoid blocking the
-        # async event loop during startup.
-        await asyncio.to_thread(sky.api_info)
-        yield {}
+        # Imported here rather than at module level so that importing the
+        # app (e.g. to register tools) does not pay for the SDK import up
+        # front. The import takes seconds, so it runs in a thread, and it
+        # also warms the SDK for the tools' lazily imported ``sky``.
+        sky = await asyncio.to_thread(importlib.import_module, "sky")
+        from sky.server import common as server_common
+
+        endpoint = server_common.get_server_url()
+        if _read_cached_api_info(endpoint) is None:
+            # Run the blocking SDK call in a thread to avoid blocking the
+            # async event loop during startup.
+            info = await asyncio.to_thread(sky.api_info)
+            _write_cached_api_info(endpoint, info)
     except Exception:
         # Allow server to start even if SkyPilot API is not yet running.
         # SkyPilot auto-starts its local API server on first SDK call.
-        yield {}
-
-
-_TASK_YAML_REFERENCE = """\
-
-## Task YAML Format Reference
-
-Tools that accept a `task_yaml` parameter expect a SkyPilot task YAML string.
-
-### Top-level fields (all optional)
-
-- `name` — Task name
-- `resources` — Compute requirements (see below)
-- `num_nodes` — Number of nodes (for distributed tasks)
-- `setup` — Shell commands run once during provisioning
-- `run` — Shell commands run as the task
-- `envs` — Environment variables (`KEY: value`)
-- `file_mounts` — Mount local files/dirs or cloud storage to remote paths
-- `workdir` — Local directory to sync to the cluster
-- `service` — SkyServe service config (mutually exclusive with `pool`)
-- `pool` — Worker pool config (mutually exclusive with `service`)
-
-### Resources section
-
-```yaml
-resources:
-  infra: <target>               # Where to run (see infra syntax below)
-  cpus: 2+                      # CPU count ("+" means at least)
-  memory: 8+                    # Memory in GiB
-  accelerators: A100:1          # GPU/TPU type and count
-  instance_type: p3.2xlarge     # Specific instance type (optional)
-  disk_size: 256                # Disk size in GiB
-  disk_tier: best               # low | medium | high | best
-  use_spot: false               # Use spot/preemptible instances
-  ports:
-    - 8888                      # Ports to expose
-  image_id: skypilot:gpu-ubuntu-2204  # OS image (optional)
-  labels:                       # Instance labels/tags (optional)
-    team: ml
-```
-
-### Infra field syntax (targeting specific clouds/k8s/ssh)
-
-IMPORTANT: Use `resources.infra` with forward-slash separators. Do NOT use \
-nested YAML objects or colons for infrastructure targeting.
-
-Format: `<cloud>[/<region>[/<zone>]]`
-
-Examples:
-- `aws` — Any AWS region
-- `aws/us-east-1` — Specific AWS region
-- `aws/us-east-1/us-east-1a` — Specific zone
-- `gcp/us-central1` — Specific GCP region
-- `kubernetes` — Default Kubernetes context
-- `kubernetes/<context-name>` — Specific Kubernetes context
-- `k8s/<context-name>` — Same (k8s is alias for kubernetes)
-
-If omitted, SkyPilot auto-selects the cheapest option.
-
-### Service section (for sky serve)
-
-```yaml
-service:
-  replicas: 2                        # Fixed replica count
-  readiness_probe:
-    path: /health                    # Health-check endpoint
-    initial_delay_seconds: 300       # Delay before first probe
-  # Or for autoscaling:
-  replica_policy:
-    min_replicas: 1
-    max_replicas: 10
-    target_qps_per_replica: 10
-```
-
-### Pool section (for worker pools)
-
-```yaml
-pool:
-  workers: 4          # Static worker count
-  # Or for autoscaling:
-  # min_workers: 1
-  # max_workers: 10
-  # queue_length_threshold: 5
-```
-
-### Job groups (multi-document YAML for parallel tasks)
-
-Separate tasks with `---`. Each task has its own resources/setup/run:
-
-```yaml
-name: my-pipeline
----
-name: train
-resources:
-  accelerators: V100:1
-run: python train.py
----
-name: eval
-resources:
-  accelerators: T4:1
-run: python eval.py
-```
-
-### Accelerator format
-
-String: `"V100"`, `"V100:2"`, `"A100:4"`, `"L4:1"`, `"H100:8"`
-Dict: `{V100: 2}`
-List (any-of): `["V100:1", "A100:1"]`
-
-### File mounts
-
-```yaml
-file_mounts:
-  /remote/path: /local/path          # Local file or directory
-  /data:
-    name: my-bucket                   # Cloud storage bucket
-    mode: MOUNT                       # MOUNT or COPY
-```
-
-### Kubernetes and ports
-
-On Kubernetes, `ports` requires ingress or load-balancer support, which not \
-all clusters have. If a launch fails with a ports-related RBAC error (e.g., \
-cannot list `ingressclasses`), retry without `ports` and tell the user to \
-access the service via SSH port forwarding instead: \
-`ssh <cluster_name> -L <port>:localhost:<port>`
-
-### Complete examples
-
-Cluster with Jupyter on Kubernetes (no `ports` — use SSH forwarding):
-```yaml
-resources:
-  infra: kubernetes/my-context
-  cpus: 2+
-  memory: 4+
-setup: pip install jupyter
-run: jupyter notebook --no-browser --port=8888 --ip=0.0.0.0 \
-  --NotebookApp.token='' --NotebookApp.password=''
-```
-
-GPU training on AWS:
-```yaml
-resources:
-  infra: aws/us-east-1
-  accelerators: A100:1
-  disk_size: 500
-setup: pip install torch
-run: python train.py --epochs 100
-```
-"""
+        pass
+
+
+def _api_info_cache_path() -> pathlib.Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return pathlib.Path(cache_home) / "skypilot-mcp" / "api_info.json"
+
+
+def _read_cached_api_info(endpoint: str) -> Any:
+    """Return the cached api_info for endpoint, or None if missing or stale."""
+    path = _api_info_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > _API_INFO_CACHE_TTL:
+            return None
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("endpoint") != endpoint:
+        return None
+    return data.get("api_info")
+
+
+def _write_cached_api_info(endpoint: str, info: Any) -> None:
+    """Persist a successful probe result; failures to write are ignored."""
+    if hasattr(info, "model_dump"):
+        info = info.model_dump(mode="json")
+    path = _api_info_cache_path()
+    # Write to a per-process temp file and rename, so concurrently starting
+    # servers never read a partially written cache.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(
+            orjson.dumps({"endpoint": endpoint, "api_info": info}, default=str)
+        )
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+# Server instructions (overview plus the task YAML reference) live in a
+# package resource so they can be edited as plain Markdown. Interned so every
+# handshake reuses the same string object.
+_INSTRUCTIONS = sys.intern(
+    importlib.resources.files("skypilot_mcp")
+    .joinpath("instructions.md")
+    .read_text(encoding="utf-8")
+)
+
+
+class _SkyPilotMCP(FastMCP):
+    """FastMCP server whose tools declare no output schema by default.
+
+    Every tool returns a str that is already JSON or plain log text. For a
+    ``-> str`` tool FastMCP would otherwise declare a ``{"result": string}``
+    output schema and send each result twice, once as text content and
+    once JSON-encoded as structured content. Without a schema the string
+    is sent once, as text.
+    """
+
+    def tool(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("output_schema", None)
+        return super().tool(*args, **kwargs)
+
 
-mcp = FastMCP(
+mcp = _SkyPilotMCP(
     "skypilot-mcp",
-    instructions=(
-        "SkyPilot MCP server for managing cloud clusters, jobs, and resources. "
-        "Long-running operations (launch, exec, stop, down, start) return a "
-        "request_id. Use skypilot_get_request to poll for their results."
-        + _TASK_YAML_REFERENCE
-    ),
+    instructions=_INSTRUCTIONS,
     lifespan=skypilot_lifespan,
 )
@@ -1,71 +1,332 @@
 """Shared helpers for SkyPilot MCP tools."""
 
+import asyncio
+import collections
 import concurrent.futures
+import contextlib
+import contextvars
+import copy
 import dataclasses
 import enum
 import functools
-import io
+import importlib
+import inspect
 import json
+import logging
+import operator
+import os
 import pathlib
+import sys
 import threading
+import time
+import weakref
 from typing import Any
 
-import sky
 from fastmcp.exceptions import ToolError
-from sky.exceptions import (
-    ApiServerAuthenticationError,
-    ApiServerConnectionError,
-    APINotSupportedError,
-    APIVersionMismatchError,
-    CloudError,
-    ClusterDoesNotExist,
-    ClusterNotUpError,
-    ClusterSetUpError,
-    CommandError,
-    InvalidCloudConfigs,
-    InvalidCloudCredentials,
-    InvalidClusterNameError,
-    NetworkError,
-    NoCloudAccessError,
-    NotSupportedError,
-    PermissionDeniedError,
-    PortDoesNotExistError,
-    RequestCancelled,
-    ResourcesUnavailableError,
-    ServerTemporarilyUnavailableError,
-    StorageError,
-    UserRequestRejectedByPolicy,
-    VolumeNotFoundError,
-)
 
 try:
-    from sky.exceptions import VolumeNotReadyError
+    import orjson
 except ImportError:
-    # VolumeNotReadyError is not available in older skypilot versions;
-    # define a placeholder that will never match a raised exception.
-    class VolumeNotReadyError(Exception):  # type: ignore[no-redef]
-        pass
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Importing ``sky`` loads the whole SDK (clouds, backends, catalogs) and
+    takes seconds, so modules bind this proxy instead and the import runs on
+    the first SDK call rather than while the server starts. Async tools
+    import it beforehand in a worker thread (see _aimport_sdk), so the
+    event loop never waits on the import.
+    """
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
 
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
 
-# Default timeout (seconds) for blocking resolve_request calls.
+    def _load(self) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
+
+
+sky = _LazyModule("sky")
+
+
+# Default timeout (seconds) for aresolve_request calls.
 # Slightly less than the MCP tool timeout (600s) to ensure a clean
 # TimeoutError is returned before the MCP framework kills the handler.
 DEFAULT_RESOLVE_TIMEOUT = 580
 
-# Lock for functions that redirect stdout/stderr (process-global) to capture
-# output from SDK calls that don't support an output_stream parameter.
-_STDOUT_REDIRECT_LOCK = threading.Lock()
+# Exponential backoff used while polling a request's status: start at
+# POLL_MIN_INTERVAL and multiply by POLL_BACKOFF_FACTOR after each poll
+# (50ms, 100ms, 200ms, ...). Once the delay reaches POLL_MAX_INTERVAL the
+# request is clearly not short-lived, so polling stops and the result is
+# fetched with sky.get, which long-polls /api/get until the request finishes.
+DEFAULT_POLL_MIN_INTERVAL = 0.05
+DEFAULT_POLL_MAX_INTERVAL = 2.0
+DEFAULT_POLL_BACKOFF_FACTOR = 2.0
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Return env var ``name`` as a positive int, else warn and use ``default``."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed <= 0:
+        logger.warning(
+            "Ignoring %s=%r: expected a positive integer, using %d.",
+            name,
+            value,
+            default,
+        )
+        return default
+    return parsed
+
+
+# Upper bound (bytes) on log text returned by the tail_* log tools. Clients
+# only show the end of a log, so anything older is dropped before the
+# response is encoded. Override with SKYMCP_LOG_MAX_BYTES; invalid values
+# fall back to the default so a bad setting cannot stop the server starting.
+LOG_MAX_BYTES = _env_positive_int("SKYMCP_LOG_MAX_BYTES", 512_000)
+
+# Request statuses after which sky.get returns without blocking.
+_FINISHED_REQUEST_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+# Dedicated pool for sky.get long-polls. A long-poll holds its thread until
+# the request finishes (up to DEFAULT_RESOLVE_TIMEOUT), so running them on
+# the default executor would let a few long launches take every worker and
+# queue status polls and new submissions behind them. Extra long-polls wait
+# here for a free worker instead.
+_LONG_POLL_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix="sky-long-poll"
+)
+
+# Buffer that stdout/stderr writes from the current context are routed to.
+# Set by capture_stdio() to capture output from SDK calls that don't support
+# an output_stream parameter; None means "write to the real stream".
+_CAPTURE_STREAM: contextvars.ContextVar[Any] = contextvars.ContextVar(
+    "_CAPTURE_STREAM", default=None
+)
+# Number of capture_stdio() blocks currently open, in any context. The
+# stdio routers are installed while it is non-zero.
+_ACTIVE_CAPTURES = 0
+_ROUTERS_LOCK = threading.Lock()
+# Set by mark_stdout_as_protocol() when the server runs over the stdio
+# transport, where sys.stdout carries the MCP messages.
+_STDOUT_IS_PROTOCOL = False
+
+
+class _ListStream:
+    """Minimal write-only text stream that collects chunks in a list.
+
+    Used as ``output_stream`` for SDK log calls: joining the parts once at
+    the end avoids the extra full-buffer copy of ``StringIO.getvalue()``.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts: list[str] = []
+
+    def write(self, s: str) -> int:
+        self.parts.append(s)
+        return len(s)
+
+    def writelines(self, lines) -> None:
+        self.parts.extend(lines)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+class _BoundedListStream(_ListStream):
+    """_ListStream that keeps only the most recent ``max_chars`` of text.
+
+    Whole chunks are dropped from the front once the remaining ones still
+    hold at least ``max_chars`` characters, so memory is bounded by the
+    budget plus one chunk instead of by the full log.
+    """
+
+    __slots__ = ("_max_chars", "_size")
+
+    def __init__(self, max_chars: int):
+        self.parts = collections.deque()
+        self._max_chars = max_chars
+        self._size = 0
+
+    def write(self, s: str) -> int:
+        parts = self.parts
+        parts.append(s)
+        self._size += len(s)
+        while len(parts) > 1 and self._size - len(parts[0]) >= self._max_chars:
+            self._size -= len(parts.popleft())
+        return len(s)
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+
+class _ContextRoutedStream:
+    """Stand-in for sys.stdout/sys.stderr that honours ``_CAPTURE_STREAM``.
+
+    Writes go to the capture buffer of the calling context if one is set,
+    otherwise to the wrapped stream. Everything else (``buffer``,
+    ``fileno``, ``encoding``...) is delegated to the wrapped stream.
+
+    Threads started by the SDK itself (log streamers, spinners) do not
+    inherit the context of the capturing call. With ``spill_to_stderr``,
+    their stdout writes go to sys.stderr when stdout carries the MCP
+    protocol (see mark_stdout_as_protocol).
+    """
+
+    def __init__(self, wrapped, spill_to_stderr: bool = False):
+        self._wrapped = wrapped
+        self._spill_to_stderr = spill_to_stderr
+
+    def _target(self):
+        buf = _CAPTURE_STREAM.get()
+        if buf is not None:
+            return buf
+        if self._spill_to_stderr and _STDOUT_IS_PROTOCOL:
+            return sys.stderr
+        return self._wrapped
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def writelines(self, lines) -> None:
+        self._target().writelines(lines)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._wrapped, name)
+
+
+def mark_stdout_as_protocol() -> None:
+    """Declare that sys.stdout carries the MCP protocol (stdio transport).
+
+    Output that the SDK writes to stdout outside a capture is then sent to
+    stderr while captures are open, so it cannot corrupt the messages.
+    """
+    global _STDOUT_IS_PROTOCOL
+    _STDOUT_IS_PROTOCOL = True
+
+
+def _acquire_stdio_routers() -> None:
+    """Wrap sys.stdout/sys.stderr in routers for one more open capture."""
+    global _ACTIVE_CAPTURES
+    with _ROUTERS_LOCK:
+        _ACTIVE_CAPTURES += 1
+        if not isinstance(sys.stdout, _ContextRoutedStream):
+            sys.stdout = _ContextRoutedStream(sys.stdout, spill_to_stderr=True)
+        if not isinstance(sys.stderr, _ContextRoutedStream):
+            sys.stderr = _ContextRoutedStream(sys.stderr)
+
+
+def _release_stdio_routers() -> None:
+    """Restore the original streams once the last open capture closes."""
+    global _ACTIVE_CAPTURES
+    with _ROUTERS_LOCK:
+        _ACTIVE_CAPTURES -= 1
+        if _ACTIVE_CAPTURES:
+            return
+        # Leave the streams alone if something else replaced them since.
+        if isinstance(sys.stdout, _ContextRoutedStream):
+            sys.stdout = sys.stdout._wrapped
+        if isinstance(sys.stderr, _ContextRoutedStream):
+            sys.stderr = sys.stderr._wrapped
+
+
+_TRUNCATED_MARKER = "...[truncated]\n"
 
 
-def create_task_from_yaml(yaml_str: str) -> sky.Task:
+def _tail_bytes(s: str, max_bytes: int) -> str:
+    """Return the end of ``s`` that fits in ``max_bytes`` of UTF-8.
+
+    Truncated output starts at a line boundary where possible and is
+    prefixed with a marker. Strings within budget are returned unchanged.
+    """
+    # A character is at most 4 bytes of UTF-8; skip encoding short strings.
+    if len(s) * 4 <= max_bytes:
+        return s
+    data = s.encode()
+    if len(data) <= max_bytes:
+        return s
+    tail = data[-max_bytes:]
+    newline = tail.find(b"\n")
+    if 0 <= newline < len(tail) - 1:
+        tail = tail[newline + 1 :]
+    return _TRUNCATED_MARKER + tail.decode(errors="ignore")
+
+
+@contextlib.contextmanager
+def capture_stdio(buf):
+    """Route this context's stdout/stderr writes into ``buf``.
+
+    Unlike contextlib.redirect_stdout, the redirection is scoped to the
+    current context (thread or task) via a ContextVar, so concurrent
+    captures neither need a global lock nor see each other's output.
+    Output written directly to file descriptors (e.g. by subprocesses) is
+    not captured. Under the stdio transport, stdout writes from contexts
+    without a capture (such as threads the SDK starts) go to stderr while
+    the block is open. The original streams are restored once no capture
+    is open.
+    """
+    _acquire_stdio_routers()
+    token = _CAPTURE_STREAM.set(buf)
+    try:
+        yield buf
+    finally:
+        _CAPTURE_STREAM.reset(token)
+        _release_stdio_routers()
+
+
+# Number of distinct task YAML strings whose parsed Task/DAG is kept.
+# Agents commonly resubmit the same spec (optimize -> validate -> launch),
+# and parsing costs ~2ms while copying a parsed object costs ~0.1ms.
+YAML_PARSE_CACHE_SIZE = 128
+
+
+def create_task_from_yaml(yaml_str: str) -> "sky.Task":
     """Create a SkyPilot Task from a YAML string.
 
+    Parsed tasks are cached by YAML content; each call returns a fresh deep
+    copy, so callers may mutate the result.
+
     Raises:
         ValueError: If the YAML string is empty or None.
     """
     if not yaml_str or not yaml_str.strip():
         raise ValueError("task_yaml must be a non-empty YAML string.")
-    return sky.Task.from_yaml_str(yaml_str)
+    return copy.deepcopy(_parse_task_yaml(yaml_str))
 
 
 def load_dag_from_yaml(yaml_str: str):
@@ -73,41 +334,252 @@ def load_dag_from_yaml(yaml_str: str):
 
     Auto-detects whether the YAML defines a single task, a chain DAG,
     or a job group (multi-document YAML with execution: parallel).
+    Parsed DAGs are cached like in create_task_from_yaml.
 
     Raises:
         ValueError: If the YAML string is empty or None.
     """
     if not yaml_str or not yaml_str.strip():
         raise ValueError("task_yaml must be a non-empty YAML string.")
-    from sky.utils import dag_utils
+    return copy.deepcopy(_parse_dag_yaml(yaml_str))
+
+
+# Keyed on the YAML string itself: str hashes are computed once and cached
+# on the object, so a separate content digest would only add work.
+@functools.lru_cache(maxsize=YAML_PARSE_CACHE_SIZE)
+def _parse_task_yaml(yaml_str: str) -> "sky.Task":
+    return sky.Task.from_yaml_str(yaml_str)
 
-    return dag_utils.load_chain_dag_from_yaml_str(yaml_str)
 
+@functools.lru_cache(maxsize=YAML_PARSE_CACHE_SIZE)
+def _parse_dag_yaml(yaml_str: str):
+    return _dag_utils().load_chain_dag_from_yaml_str(yaml_str)
 
-def resolve_request(request_id: str, timeout: int = DEFAULT_RESOLVE_TIMEOUT) -> Any:
-    """Block until a SkyPilot request completes and return the result.
 
-    Uses a ThreadPoolExecutor so the future is tracked and the thread is
-    reused from a pool rather than leaked on timeout.
+async def aresolve_request(
+    request_id: str,
+    timeout: int = DEFAULT_RESOLVE_TIMEOUT,
+    poll_min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+    poll_max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+    poll_backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+) -> Any:
+    """Wait for a SkyPilot request to complete and return the result.
+
+    The request status is polled with an exponential backoff so short
+    requests return as soon as they are done. Longer requests, and requests
+    whose status cannot be queried, are handed to ``sky.get``, a server-side
+    long-poll that returns in one round-trip once the request finishes.
+
+    Status polls and the final ``sky.get`` run in worker threads and the
+    backoff sleeps are cooperative, so the event loop keeps serving other
+    tool calls while the request is pending. Polls that overlap with those
+    of other pending tool calls are merged into one ``sky.api_status`` call
+    (see _StatusBatcher).
 
     Args:
         request_id: The SkyPilot request ID to wait on.
         timeout: Maximum seconds to wait. Defaults to DEFAULT_RESOLVE_TIMEOUT.
+        poll_min_interval: Delay in seconds before the second status poll.
+        poll_max_interval: Poll delay in seconds after which polling stops
+            and the wait continues as a long-poll.
+        poll_backoff_factor: Multiplier applied to the delay after each poll.
 
     Raises:
         TimeoutError: If the request does not complete within the timeout.
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        future = pool.submit(sky.get, request_id)
-        try:
-            return future.result(timeout=timeout)
-        except concurrent.futures.TimeoutError:
-            future.cancel()
-            raise TimeoutError(
-                f"Request {request_id} did not complete within {timeout}s. "
-                f"The request may still be running on the server. "
-                f"Use skypilot_api_status to check its status."
+    deadline = time.monotonic() + timeout
+    delays = _poll_delays(poll_min_interval, poll_max_interval, poll_backoff_factor)
+    batcher = _status_batcher()
+    try:
+        for delay in delays:
+            statuses = await asyncio.wait_for(
+                batcher.poll([request_id]), timeout=_remaining(deadline)
+            )
+            if statuses.get(request_id) is not False:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _resolve_timeout_error(request_id, timeout)
+            await asyncio.sleep(min(delay, remaining))
+        return await asyncio.wait_for(
+            _long_poll(request_id), timeout=_remaining(deadline)
+        )
+    except asyncio.TimeoutError:
+        raise _resolve_timeout_error(request_id, timeout)
+
+
+async def aresolve_requests(
+    request_ids: list[str],
+    timeout: int = DEFAULT_RESOLVE_TIMEOUT,
+    poll_min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+    poll_max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+    poll_backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+) -> dict[str, Any]:
+    """Resolve several SkyPilot requests, sharing one status poll per tick.
+
+    Like aresolve_request, but each poll fetches the status of every pending
+    request in a single ``sky.api_status`` call instead of one call per
+    request. A request's result is fetched with ``sky.get`` as soon as it is
+    seen finished; requests still pending when polling stops are long-polled
+    concurrently.
+
+    Returns:
+        A dict mapping each request ID to its result.
+
+    Raises:
+        TimeoutError: If the requests do not all complete within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delays = _poll_delays(poll_min_interval, poll_max_interval, poll_backoff_factor)
+    pending = list(dict.fromkeys(request_ids))
+    fetches: dict[str, asyncio.Future] = {}
+
+    def fetch(ids) -> None:
+        for request_id in ids:
+            fetches[request_id] = asyncio.ensure_future(_long_poll(request_id))
+
+    batcher = _status_batcher()
+    try:
+        for delay in delays:
+            statuses = await asyncio.wait_for(
+                batcher.poll(pending), timeout=_remaining(deadline)
             )
+            # Fetch finished requests, and those whose status is unknown so
+            # that sky.get surfaces the real error.
+            fetch(r for r in pending if statuses.get(r) is not False)
+            pending = [r for r in pending if statuses.get(r) is False]
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _resolve_timeout_error(", ".join(pending), timeout)
+            await asyncio.sleep(min(delay, remaining))
+        fetch(pending)
+        results = await asyncio.wait_for(
+            asyncio.gather(*fetches.values()), timeout=_remaining(deadline)
+        )
+    except asyncio.TimeoutError:
+        unfinished = [r for r, f in fetches.items() if not f.done()] or pending
+        raise _resolve_timeout_error(", ".join(unfinished), timeout)
+    finally:
+        for future in fetches.values():
+            future.cancel()
+    return dict(zip(fetches, results))
+
+
+async def arun_and_serialize(fn, /, *args: Any, **kwargs: Any) -> str:
+    """Submit an SDK request, wait for its result and serialize it to JSON.
+
+    The common body of read-only tools: ``fn(*args, **kwargs)`` runs in a
+    worker thread, the returned request ID is resolved with aresolve_request
+    and the result is encoded with safe_json_serialize.
+    """
+    request_id = await asyncio.to_thread(fn, *args, **kwargs)
+    return safe_json_serialize(await aresolve_request(request_id))
+
+
+async def _long_poll(request_id: str) -> Any:
+    """Wait for a request's result with ``sky.get`` on _LONG_POLL_POOL."""
+    # Like asyncio.to_thread, run the call in a copy of the current context.
+    call = functools.partial(contextvars.copy_context().run, sky.get, request_id)
+    return await asyncio.get_running_loop().run_in_executor(_LONG_POLL_POOL, call)
+
+
+def _poll_delays(min_interval: float, max_interval: float, factor: float):
+    """Yield an exponential backoff schedule ending with max_interval."""
+    delay = min_interval
+    while delay < max_interval and factor > 1:
+        yield delay
+        delay *= factor
+    yield max_interval
+
+
+def _remaining(deadline: float) -> float:
+    return max(deadline - time.monotonic(), 0)
+
+
+def _request_statuses(request_ids: list[str]) -> dict[str, bool | None]:
+    """Return whether each request has finished, or None if its status is unknown."""
+    try:
+        rows = sky.api_status(request_ids=request_ids)
+    except Exception:
+        # Let the subsequent sky.get calls surface the real error.
+        return dict.fromkeys(request_ids)
+    if not isinstance(rows, list) or not rows:
+        return dict.fromkeys(request_ids)
+    if len(request_ids) == 1:
+        # Every returned row matches the one (prefix) ID that was asked for.
+        return {request_ids[0]: _status_name(rows[0]) in _FINISHED_REQUEST_STATUSES}
+    statuses = dict.fromkeys(request_ids)
+    for row in rows:
+        request_id = getattr(row, "request_id", None)
+        if request_id in statuses:
+            statuses[request_id] = _status_name(row) in _FINISHED_REQUEST_STATUSES
+    return statuses
+
+
+class _StatusBatcher:
+    """Merges concurrent request status polls into shared api_status calls.
+
+    Each async resolve polls on its own backoff schedule. While one
+    ``sky.api_status`` call is in flight, polls from other tool calls queue
+    up and are sent together as the next call, so N concurrent waiters cost
+    one status round-trip per tick instead of N. An idle batcher sends a
+    poll on the next event loop iteration, so a lone waiter is not delayed.
+    """
+
+    def __init__(self) -> None:
+        self._queued: dict[str, None] = {}
+        self._next: asyncio.Future | None = None
+        self._sender: asyncio.Task | None = None
+
+    async def poll(self, request_ids: list[str]) -> dict[str, bool | None]:
+        self._queued.update(dict.fromkeys(request_ids))
+        if self._next is None:
+            self._next = asyncio.get_running_loop().create_future()
+        if self._sender is None:
+            self._sender = asyncio.ensure_future(self._send())
+        # Shielded: a waiter timing out must not cancel the shared poll.
+        return await asyncio.shield(self._next)
+
+    async def _send(self) -> None:
+        try:
+            while self._next is not None:
+                future, request_ids = self._next, list(self._queued)
+                self._next, self._queued = None, {}
+                try:
+                    statuses = await asyncio.to_thread(_request_statuses, request_ids)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                future.set_result(statuses)
+        finally:
+            self._sender = None
+
+
+# One batcher per event loop, since its futures are bound to the loop.
+_STATUS_BATCHERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _status_batcher() -> _StatusBatcher:
+    loop = asyncio.get_running_loop()
+    batcher = _STATUS_BATCHERS.get(loop)
+    if batcher is None:
+        batcher = _STATUS_BATCHERS[loop] = _StatusBatcher()
+    return batcher
+
+
+def _status_name(row: Any) -> Any:
+    status = getattr(row, "status", None)
+    return getattr(status, "value", status)
+
+
+def _resolve_timeout_error(request_id: str, timeout: int) -> TimeoutError:
+    return TimeoutError(
+        f"Request {request_id} did not complete within {timeout}s. "
+        f"The request may still be running on the server. "
+        f"Use skypilot_api_status to check its status."
+    )
 
 
 def safe_json_serialize(obj: Any) -> str:
@@ -115,43 +587,267 @@ def safe_json_serialize(obj: Any) -> str:
 
     Handles Pydantic models, dataclasses, enums, and other
     non-trivially-serializable objects by converting them to dicts/primitives
-    before JSON encoding.
+    before JSON encoding. Encodes with orjson when available and falls back
+    to the stdlib encoder for values orjson rejects (e.g. integers wider
+    than 64 bits).
+
+    Values made only of JSON-native types (str-keyed dicts, lists, strings,
+    numbers...) are encoded directly, skipping the conversion walk.
+    """
+    return _encode(obj).decode()
+
+
+def safe_json_serialize_records(obj: Any) -> str:
+    """Serialize a large list or str-keyed dict result one element at a time.
+
+    Produces the same JSON as safe_json_serialize, but each element is
+    converted and encoded on its own and appended to one output buffer, so
+    at most one element's converted copy is alive at a time rather than a
+    converted copy of the whole result. List and dict values one level down
+    (e.g. the records under a "jobs" key) are framed the same way. Other
+    values are passed to safe_json_serialize.
+    """
+    return _encode_framed(obj, depth=2).decode()
+
+
+def _encode_framed(obj: Any, depth: int) -> bytes:
+    if depth and isinstance(obj, list) and obj:
+        out = bytearray(b"[")
+        for i, value in enumerate(obj):
+            out += b",\n  " if i else b"\n  "
+            out += _encode_framed(value, depth - 1).replace(b"\n", b"\n  ")
+        out += b"\n]"
+        return bytes(out)
+    if depth and isinstance(obj, dict) and obj and all(type(k) is str for k in obj):
+        out = bytearray(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            out += b",\n  " if i else b"\n  "
+            out += _encode(key) + b": "
+            out += _encode_framed(value, depth - 1).replace(b"\n", b"\n  ")
+        out += b"\n}"
+        return bytes(out)
+    return _encode(obj)
+
+
+def _encode(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_STRICT_OPTIONS)
+        except TypeError:
+            pass
+    data = _make_serializable(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a tool response made only of JSON-native types.
+
+    Used for the small status dicts tools build themselves; results from the
+    SDK go through safe_json_serialize instead.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _submitted_response(request_id: Any, message: str, **extras: Any) -> str:
+    """Encode the response of a tool that submitted a request to the server.
+
+    Keys are ordered request_id, then any extras (e.g. cluster_name), then
+    message.
     """
-    return json.dumps(_make_serializable(obj), indent=2, default=str)
+    return _dumps({"request_id": _as_str(request_id), **extras, "message": message})
+
+
+def _as_str(value: Any) -> str:
+    """Return value unchanged if it is already a str, else str(value).
+
+    SDK request IDs are RequestId instances, a str subclass that both
+    encoders write as a plain JSON string, so they need no conversion.
+    """
+    return value if isinstance(value, str) else str(value)
+
+
+# orjson options for the direct-encoding fast path. Dataclasses and datetimes
+# are passed through (i.e. rejected) so they take the _make_serializable route
+# and keep its output format.
+_ORJSON_STRICT_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
 
 
 def _make_serializable(obj: Any) -> Any:
-    """Recursively convert an object to a JSON-serializable form."""
-    if obj is None or isinstance(obj, (str, int, float, bool)):
-        return obj
+    """Convert an object to a JSON-serializable form.
+
+    Walks the object graph with an explicit stack rather than recursion, so
+    deeply nested SDK responses cannot hit the interpreter recursion limit.
+    Each stack entry is ``(parent, key, value)``: the converted value is
+    stored at ``parent[key]``, and containers store a pre-sized placeholder
+    there before pushing their children. The converter for each value is
+    looked up by its type, which is classified once and cached.
+
+    A container that (directly or indirectly) contains itself is written as
+    ``_CIRCULAR_MARKER`` where it recurs. The IDs of objects whose children
+    are still being converted are kept in ``active``; a ``_DONE`` entry
+    pushed below the children removes the ID once they are all converted.
+    """
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(root, 0, obj)]
+    active: set[int] = set()
+    while stack:
+        parent, key, value = stack.pop()
+        if parent is _DONE:
+            active.discard(key)
+            continue
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES:
+            parent[key] = value
+            continue
+        value_id = id(value)
+        if value_id in active:
+            parent[key] = _CIRCULAR_MARKER
+            continue
+        # The _DONE entry also keeps value alive, so its ID cannot be reused
+        # by another object while it is in ``active``.
+        stack.append((_DONE, value_id, value))
+        size = len(stack)
+        _serializer_for(value_type)(stack, parent, key, value)
+        if len(stack) == size:
+            # Nothing was pushed: value was converted in place.
+            stack.pop()
+        else:
+            active.add(value_id)
+    return root[0]
+
+
+_DONE = object()
+_CIRCULAR_MARKER = "[circular reference]"
+
+
+def _serialize_primitive(stack, parent, key, value) -> None:
+    parent[key] = value
+
+
+def _serialize_pydantic_v2(stack, parent, key, value) -> None:
+    stack.append((parent, key, value.model_dump()))
+
+
+def _serialize_pydantic_v1(stack, parent, key, value) -> None:
+    stack.append((parent, key, value.dict()))
+
+
+def _serialize_dataclass(stack, parent, key, value) -> None:
+    # Iterate fields directly to avoid deep-copy issues from
+    # dataclasses.asdict() which can fail on non-copyable fields.
+    names, getter = _dataclass_field_getter(type(value))
+    _push_pairs(stack, parent, key, list(zip(names, getter(value))))
+
+
+def _serialize_enum(stack, parent, key, value) -> None:
+    parent[key] = value.value
+
+
+def _serialize_dict(stack, parent, key, value) -> None:
+    _push_pairs(stack, parent, key, [(str(k), v) for k, v in value.items()])
+
+
+def _serialize_set(stack, parent, key, value) -> None:
+    # Convert to a sorted list where possible
+    try:
+        items = sorted(value)
+    except TypeError:
+        items = list(value)
+    _push_list(stack, parent, key, items)
+
+
+def _serialize_other(stack, parent, key, value) -> None:
+    parent[key] = _serialize_leaf(value)
+
+
+def _push_pairs(stack: list, parent: Any, key: Any, pairs: list) -> None:
+    out = dict.fromkeys(k for k, _ in pairs)
+    parent[key] = out
+    # Push in reverse so entries are converted in their original order
+    # (matters only when two keys stringify to the same value).
+    stack.extend((out, k, v) for k, v in reversed(pairs))
+
+
+def _push_list(stack: list, parent: Any, key: Any, items) -> None:
+    out: list[Any] = [None] * len(items)
+    parent[key] = out
+    stack.extend((out, i, items[i]) for i in range(len(items) - 1, -1, -1))
+
+
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Converters for exact built-in types; subclasses go through _serializer_for.
+_SERIALIZERS = {
+    dict: _serialize_dict,
+    list: _push_list,
+    tuple: _push_list,
+    set: _serialize_set,
+    frozenset: _serialize_set,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _serializer_for(cls: type):
+    """Return the converter for instances of ``cls``.
+
+    Checks run in the same order the per-value isinstance chain used to, so
+    e.g. str-based enums still serialize as plain strings.
+    """
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is not None:
+        return serializer
+    if issubclass(cls, (str, int, float, bool)):
+        return _serialize_primitive
     # Pydantic v2 models
-    if hasattr(obj, "model_dump"):
-        return _make_serializable(obj.model_dump())
+    if hasattr(cls, "model_dump"):
+        return _serialize_pydantic_v2
     # Pydantic v1 models
-    if hasattr(obj, "dict") and hasattr(obj, "__fields__"):
-        return _make_serializable(obj.dict())
-    # Dataclasses — iterate fields directly to avoid deep-copy issues
-    # from dataclasses.asdict() which can fail on non-copyable fields.
-    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-        return {
-            f.name: _make_serializable(getattr(obj, f.name))
-            for f in dataclasses.fields(obj)
-        }
-    # Enums
-    if isinstance(obj, enum.Enum):
-        return obj.value
-    # Sets/frozensets — convert to sorted list where possible
-    if isinstance(obj, (set, frozenset)):
-        try:
-            return [_make_serializable(item) for item in sorted(obj)]
-        except TypeError:
-            return [_make_serializable(item) for item in obj]
-    # Dicts — recurse into values
-    if isinstance(obj, dict):
-        return {str(k): _make_serializable(v) for k, v in obj.items()}
-    # Lists/tuples — recurse into elements
-    if isinstance(obj, (list, tuple)):
-        return [_make_serializable(item) for item in obj]
+    if hasattr(cls, "dict") and hasattr(cls, "__fields__"):
+        return _serialize_pydantic_v1
+    if dataclasses.is_dataclass(cls):
+        return _serialize_dataclass
+    if issubclass(cls, enum.Enum):
+        return _serialize_enum
+    if issubclass(cls, (set, frozenset)):
+        return _serialize_set
+    if issubclass(cls, dict):
+        return _serialize_dict
+    if issubclass(cls, (list, tuple)):
+        return _push_list
+    return _serialize_other
+
+
+@functools.lru_cache(maxsize=1024)
+def _dataclass_field_getter(cls: type) -> tuple[tuple[str, ...], Any]:
+    """Return a dataclass's field names and a getter for all their values.
+
+    The getter is a single C-level ``operator.attrgetter`` that returns the
+    field values as a tuple in field order.
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    if len(names) == 1:
+        single = operator.attrgetter(names[0])
+        return names, lambda obj: (single(obj),)
+    if not names:
+        return names, lambda obj: ()
+    return names, operator.attrgetter(*names)
+
+
+def _serialize_leaf(obj: Any) -> Any:
+    """Convert a non-container value to a JSON-serializable form."""
     # bytes — decode to string
     if isinstance(obj, bytes):
         try:
@@ -181,7 +877,7 @@ def capture_cluster_logs(
     Raises RuntimeError if the underlying tail_logs call returns a non-zero
     exit code (indicating failure to retrieve logs).
     """
-    buf = io.StringIO()
+    buf = _ListStream()
     exit_code = sky.tail_logs(
         cluster_name, job_id, follow=False, tail=tail, output_stream=buf
     )
@@ -206,7 +902,7 @@ def capture_managed_job_logs(
     Raises RuntimeError if the underlying tail_logs call returns a non-zero
     exit code.
     """
-    buf = io.StringIO()
+    buf = _ListStream()
     # sky.jobs.tail_logs uses None for "all lines" and asserts tail > 0
     # when specified, so convert 0 to None.
     sdk_tail = None if tail == 0 else tail
@@ -236,7 +932,7 @@ def capture_serve_logs(
     tail: int = 100,
 ) -> str:
     """Capture service logs into a string."""
-    buf = io.StringIO()
+    buf = _ListStream()
     # sky.serve.tail_logs uses None for "all lines"; convert 0 to None.
     sdk_tail = None if tail == 0 else tail
     sky.serve.tail_logs(
@@ -257,7 +953,7 @@ def capture_pool_logs(
     tail: int = 100,
 ) -> str:
     """Capture pool logs into a string."""
-    buf = io.StringIO()
+    buf = _ListStream()
     # sky.jobs.pool_tail_logs uses None for "all lines"; convert 0 to None.
     sdk_tail = None if tail == 0 else tail
     sky.jobs.pool_tail_logs(
@@ -271,21 +967,117 @@ def capture_pool_logs(
     return buf.getvalue()
 
 
+def capture_api_server_logs(tail: int | None = 100) -> str:
+    """Capture API server logs into a string.
+
+    ``sky.api_server_logs`` writes to the process stdout: for a local server
+    it runs ``tail`` in a subprocess that inherits fd 1, which neither
+    Python-level redirection captures nor is safe on the stdio transport
+    (fd 1 carries the MCP protocol). Instead, read the local log file
+    directly, and for a remote server stream the logs into a buffer.
+    """
+    from sky.server import common as server_common
+    from sky.skylet import constants, runtime_utils
+
+    if server_common.is_api_server_local():
+        return _tail_file(runtime_utils.expanduser(constants.API_SERVER_LOGS), tail)
+    buf = _ListStream()
+    sky.stream_and_get(log_path=constants.API_SERVER_LOGS, tail=tail, output_stream=buf)
+    return buf.getvalue()
+
+
+def _tail_file(path: str, lines: int | None, block_size: int = 65536) -> str:
+    """Return the last ``lines`` lines of a file, like ``tail -n``.
+
+    Reads backwards in blocks as raw bytes and decodes once at the end.
+    ``lines=None`` returns the whole file; a missing file yields "". As
+    with ``tail -n``, a negative count means the same as its absolute value.
+    """
+    if lines is not None:
+        lines = abs(lines)
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return ""
+    with f:
+        if lines is None:
+            data = f.read()
+        elif lines == 0:
+            data = b""
+        else:
+            pos = f.seek(0, os.SEEK_END)
+            chunks: list[bytes] = []
+            newlines = 0
+            # One more newline than requested guarantees `lines` complete
+            # lines even when the file ends with a newline.
+            while pos > 0 and newlines <= lines:
+                size = min(block_size, pos)
+                pos -= size
+                f.seek(pos)
+                chunk = f.read(size)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+            data = b"".join(reversed(chunks))
+            trailing = data.endswith(b"\n")
+            kept = (data[:-1] if trailing else data).split(b"\n")[-lines:]
+            data = b"\n".join(kept) + (b"\n" if trailing else b"")
+    return data.decode("utf-8", errors="replace")
+
+
+# The SDK modules below are imported on first use and cached, so modules that
+# never parse these values don't pay for the import. Enums are cached as
+# name -> member tables so each parse is a single dict lookup.
+
+
+@functools.lru_cache(maxsize=1)
+def _dag_utils():
+    from sky.utils import dag_utils
+
+    return dag_utils
+
+
+@functools.lru_cache(maxsize=1)
+def _optimize_targets() -> dict[str, Any]:
+    from sky.utils.common import OptimizeTarget
+
+    return {t.name: t for t in OptimizeTarget}
+
+
+@functools.lru_cache(maxsize=1)
+def _status_refresh_modes() -> dict[str, Any]:
+    from sky.utils.common import StatusRefreshMode
+
+    return {m.name: m for m in StatusRefreshMode}
+
+
+@functools.lru_cache(maxsize=1)
+def _update_modes() -> dict[str, Any]:
+    from sky.serve.serve_utils import UpdateMode
+
+    return {m.value: m for m in UpdateMode}
+
+
+@functools.lru_cache(maxsize=1)
+def _autostop_wait_fors() -> dict[str, Any]:
+    from sky.skylet.autostop_lib import AutostopWaitFor
+
+    return {w.value: w for w in AutostopWaitFor}
+
+
 def _parse_optimize_target(value: str) -> "sky.OptimizeTarget":
     """Parse an optimize target string to the enum, with a clear error message.
 
     Raises:
         ValueError: If the value is not a valid OptimizeTarget.
     """
-    from sky.utils.common import OptimizeTarget
-
-    try:
-        return OptimizeTarget[value.upper()]
-    except KeyError:
-        valid = ", ".join(t.name for t in OptimizeTarget)
+    targets = _optimize_targets()
+    target = targets.get(value.upper())
+    if target is None:
+        valid = ", ".join(targets)
         raise ValueError(
             f"Invalid optimize target: {value!r}. Must be one of: {valid}."
         )
+    return target
 
 
 def _parse_status_refresh_mode(value: str) -> Any:
@@ -296,13 +1088,12 @@ def _parse_status_refresh_mode(value: str) -> Any:
     Raises:
         ValueError: If the value is not a valid StatusRefreshMode.
     """
-    from sky.utils.common import StatusRefreshMode
-
-    try:
-        return StatusRefreshMode[value.upper()]
-    except KeyError:
-        valid = ", ".join(m.name for m in StatusRefreshMode)
+    modes = _status_refresh_modes()
+    mode = modes.get(value.upper())
+    if mode is None:
+        valid = ", ".join(modes)
         raise ValueError(f"Invalid refresh mode: {value!r}. Must be one of: {valid}.")
+    return mode
 
 
 def _parse_update_mode(value: str) -> Any:
@@ -311,13 +1102,48 @@ def _parse_update_mode(value: str) -> Any:
     Raises:
         ValueError: If the value is not a valid UpdateMode.
     """
-    from sky.serve.serve_utils import UpdateMode
-
-    try:
-        return UpdateMode(value)
-    except ValueError:
-        valid = ", ".join(m.value for m in UpdateMode)
+    modes = _update_modes()
+    mode = modes.get(value)
+    if mode is None:
+        valid = ", ".join(modes)
         raise ValueError(f"Invalid update mode: {value!r}. Must be one of: {valid}.")
+    return mode
+
+
+def _parse_wait_for(value: str) -> Any:
+    """Parse an autostop wait_for string to the enum, with a clear error message.
+
+    Raises:
+        ValueError: If the value is not a valid AutostopWaitFor.
+    """
+    wait_fors = _autostop_wait_fors()
+    wait_for = wait_fors.get(value)
+    if wait_for is None:
+        valid = ", ".join(wait_fors)
+        raise ValueError(f"Invalid wait_for: {value!r}. Must be one of: {valid}.")
+    return wait_for
+
+
+def _require_exactly_one(**named: Any) -> None:
+    """Check that exactly one of several mutually exclusive arguments is set.
+
+    An argument counts as set when it is truthy, so None, False and empty
+    lists are all "not given". Flags are shown as ``name=True`` in errors.
+
+    Raises:
+        ValueError: If none or more than one of the arguments is set.
+    """
+    given = [k for k, v in named.items() if v]
+    if len(given) == 1:
+        return
+    labels = [f"{k}=True" if type(v) is bool else k for k, v in named.items()]
+    if len(labels) == 2:
+        options = " or ".join(labels)
+        conflict = ", not both"
+    else:
+        options = "exactly one of: " + ", ".join(labels)
+        conflict = f" (got {', '.join(given)})"
+    raise ValueError(f"Specify {options}{conflict if given else ''}.")
 
 
 def handle_skypilot_error(func):
@@ -325,80 +1151,112 @@ def handle_skypilot_error(func):
 
     This ensures errors are propagated via the MCP protocol's isError flag
     rather than being silently returned as successful JSON responses.
+    Works for both sync and async tool functions.
     """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with _skypilot_errors_as_tool_errors():
+                await _aimport_sdk()
+                return await func(*args, **kwargs)
+
+        return async_wrapper
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        try:
+        with _skypilot_errors_as_tool_errors():
             return func(*args, **kwargs)
-        except ToolError:
-            raise
-        # --- Authentication / authorization ---
-        except ApiServerAuthenticationError as e:
-            raise ToolError(
-                f"Authentication required: {e}. Use skypilot_api_login to authenticate."
-            ) from e
-        except PermissionDeniedError as e:
-            raise ToolError(f"Permission denied: {e}") from e
-        except UserRequestRejectedByPolicy as e:
-            raise ToolError(f"Request rejected by admin policy: {e}") from e
-        # --- API server issues ---
-        except ApiServerConnectionError as e:
-            raise ToolError(f"API server unreachable: {e}") from e
-        except ServerTemporarilyUnavailableError as e:
-            raise ToolError(
-                f"API server temporarily unavailable (retry later): {e}"
-            ) from e
-        except APIVersionMismatchError as e:
-            raise ToolError(f"API version mismatch: {e}") from e
-        except APINotSupportedError as e:
-            raise ToolError(f"API not supported by server: {e}") from e
-        # --- Cluster errors ---
-        except ClusterDoesNotExist as e:
-            raise ToolError(f"Cluster not found: {e}") from e
-        except ClusterNotUpError as e:
-            raise ToolError(f"Cluster not up: {e}") from e
-        except ClusterSetUpError as e:
-            raise ToolError(f"Cluster setup failed: {e}") from e
-        except InvalidClusterNameError as e:
-            raise ToolError(f"Invalid cluster name: {e}") from e
-        # --- Resource / cloud errors ---
-        except ResourcesUnavailableError as e:
-            raise ToolError(f"Resources unavailable: {e}") from e
-        except CloudError as e:
-            raise ToolError(f"Cloud provider error: {e}") from e
-        except InvalidCloudConfigs as e:
-            raise ToolError(f"Invalid cloud configuration: {e}") from e
-        except InvalidCloudCredentials as e:
-            raise ToolError(f"Invalid cloud credentials: {e}") from e
-        except NoCloudAccessError as e:
-            raise ToolError(f"No cloud access: {e}") from e
-        except NetworkError as e:
-            raise ToolError(f"Network error: {e}") from e
-        # --- Storage errors ---
-        except StorageError as e:
-            raise ToolError(f"Storage error: {e}") from e
-        # --- Volume errors ---
-        except VolumeNotFoundError as e:
-            raise ToolError(f"Volume not found: {e}") from e
-        except VolumeNotReadyError as e:
-            raise ToolError(f"Volume not ready: {e}") from e
-        # --- Port errors ---
-        except PortDoesNotExistError as e:
-            raise ToolError(f"Port not found: {e}") from e
-        # --- Command / support errors ---
-        except CommandError as e:
-            raise ToolError(f"Command error: {e}") from e
-        except NotSupportedError as e:
-            raise ToolError(f"Not supported: {e}") from e
-        except RequestCancelled as e:
-            raise ToolError(f"Request cancelled: {e}") from e
-        # --- Input / timeout ---
-        except ValueError as e:
-            raise ToolError(f"Invalid input: {e}") from e
-        except TimeoutError as e:
-            raise ToolError(f"Timeout: {e}") from e
-        except Exception as e:
-            raise ToolError(f"{type(e).__name__}: {e}") from e
 
     return wrapper
+
+
+async def _aimport_sdk() -> None:
+    """Import the SDK behind ``sky`` in a worker thread if not yet imported.
+
+    Tool bodies look up ``sky.<function>`` on the event loop thread. Without
+    this, the first lookup would run the multi-second import there, or
+    block on the import lock while the startup probe imports the SDK, and
+    stall every other request in the meantime.
+    """
+    if isinstance(sky, _LazyModule) and sky._module is None:
+        await asyncio.to_thread(sky._load)
+
+
+# Exception -> ToolError message templates, in priority order: the first
+# entry whose class matches the raised exception (isinstance semantics)
+# wins. ``{e}`` is the exception and ``{name}`` its class name. Strings name
+# classes in sky.exceptions, looked up only once the SDK has been imported;
+# names missing from older SkyPilot versions are skipped.
+_TOOL_ERROR_TEMPLATES: tuple[tuple[type[BaseException] | str, str], ...] = (
+    # --- Authentication / authorization ---
+    (
+        "ApiServerAuthenticationError",
+        "Authentication required: {e}. Use skypilot_api_login to authenticate.",
+    ),
+    ("PermissionDeniedError", "Permission denied: {e}"),
+    ("UserRequestRejectedByPolicy", "Request rejected by admin policy: {e}"),
+    # --- API server issues ---
+    ("ApiServerConnectionError", "API server unreachable: {e}"),
+    (
+        "ServerTemporarilyUnavailableError",
+        "API server temporarily unavailable (retry later): {e}",
+    ),
+    ("APIVersionMismatchError", "API version mismatch: {e}"),
+    ("APINotSupportedError", "API not supported by server: {e}"),
+    # --- Cluster errors ---
+    ("ClusterDoesNotExist", "Cluster not found: {e}"),
+    ("ClusterNotUpError", "Cluster not up: {e}"),
+    ("ClusterSetUpError", "Cluster setup failed: {e}"),
+    ("InvalidClusterNameError", "Invalid cluster name: {e}"),
+    # --- Resource / cloud errors ---
+    ("ResourcesUnavailableError", "Resources unavailable: {e}"),
+    ("CloudError", "Cloud provider error: {e}"),
+    ("InvalidCloudConfigs", "Invalid cloud configuration: {e}"),
+    ("InvalidCloudCredentials", "Invalid cloud credentials: {e}"),
+    ("NoCloudAccessError", "No cloud access: {e}"),
+    ("NetworkError", "Network error: {e}"),
+    # --- Storage errors ---
+    ("StorageError", "Storage error: {e}"),
+    # --- Volume errors ---
+    ("VolumeNotFoundError", "Volume not found: {e}"),
+    ("VolumeNotReadyError", "Volume not ready: {e}"),
+    # --- Port errors ---
+    ("PortDoesNotExistError", "Port not found: {e}"),
+    # --- Command / support errors ---
+    ("CommandError", "Command error: {e}"),
+    ("NotSupportedError", "Not supported: {e}"),
+    ("RequestCancelled", "Request cancelled: {e}"),
+    # --- Input / timeout ---
+    (ValueError, "Invalid input: {e}"),
+    (TimeoutError, "Timeout: {e}"),
+)
+_FALLBACK_TOOL_ERROR_TEMPLATE = "{name}: {e}"
+
+
+@functools.lru_cache(maxsize=256)
+def _tool_error_template(exc_type: type[BaseException]) -> str:
+    """Return the ToolError message template for an exception class."""
+    # Until sky.exceptions is imported, no exception can derive from its
+    # classes, so the SDK is never imported just to format an error.
+    sky_exceptions = sys.modules.get("sky.exceptions")
+    for cls, template in _TOOL_ERROR_TEMPLATES:
+        if isinstance(cls, str):
+            cls = getattr(sky_exceptions, cls, None)
+            if cls is None:
+                continue
+        if issubclass(exc_type, cls):
+            return template
+    return _FALLBACK_TOOL_ERROR_TEMPLATE
+
+
+@contextlib.contextmanager
+def _skypilot_errors_as_tool_errors():
+    """Translate SkyPilot and input exceptions raised in the block to ToolError."""
+    try:
+        yield
+    except ToolError:
+        raise
+    except Exception as e:
+        template = _tool_error_template(type(e))
+        raise ToolError(template.format(e=e, name=type(e).__name__)) from e
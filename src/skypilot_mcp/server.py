@@ -1,27 +1,53 @@
 """SkyPilot MCP Server - entry point and tool registration."""
 
 import argparse
+import importlib
 
-from skypilot_mcp.app import mcp  # noqa: F401 — re-exported for backward compat
-
-# Import tool modules to trigger @mcp.tool registration
-from skypilot_mcp.tools import (  # noqa: E402, F401
-    api_server,
-    cluster,
-    config,
-    cost,
-    dag,
-    infra,
-    jobs,
-    logs,
-    managed_jobs,
-    pools,
-    serve,
-    storage,
-    volumes,
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+
+from skypilot_mcp.app import mcp  # also re-exported for backward compat
+from skypilot_mcp.helpers import mark_stdout_as_protocol
+
+# HTTP responses at least this large are gzip-compressed for clients that
+# send Accept-Encoding: gzip. Listing tools return repetitive JSON that
+# compresses well; level 1 keeps the CPU cost low. SSE streams are never
+# compressed (Starlette excludes text/event-stream), so this applies to
+# JSON-response mode (FASTMCP_JSON_RESPONSE=true).
+HTTP_GZIP_MIN_BYTES = 16_384
+
+# Tool modules under skypilot_mcp.tools; importing one registers its tools
+# via @mcp.tool. Registration is eager on purpose: FastMCP builds each tool's
+# schema from its function signature, and clients call tools/list before
+# anything else, so deferring the imports would only move their cost
+# (~0.2s; the SDK itself is imported lazily, see helpers.sky) to the first
+# request.
+TOOL_MODULES = (
+    "api_server",
+    "cluster",
+    "config",
+    "cost",
+    "dag",
+    "infra",
+    "jobs",
+    "logs",
+    "managed_jobs",
+    "pools",
+    "serve",
+    "storage",
+    "volumes",
 )
 
 
+def register_tools() -> None:
+    """Import every tool module so its tools are registered on ``mcp``."""
+    for name in TOOL_MODULES:
+        importlib.import_module(f"skypilot_mcp.tools.{name}")
+
+
+register_tools()
+
+
 def main():
     parser = argparse.ArgumentParser(description="SkyPilot MCP Server")
     parser.add_argument(
@@ -35,7 +61,19 @@ def main():
     args = parser.parse_args()
 
     if args.transport == "stdio":
+        mark_stdout_as_protocol()
         mcp.run(transport="stdio")
+    elif args.transport == "http":
+        mcp.run(
+            transport="http",
+            host=args.host,
+            port=args.port,
+            middleware=[
+                Middleware(
+                    GZipMiddleware, minimum_size=HTTP_GZIP_MIN_BYTES, compresslevel=1
+                )
+            ],
+        )
     else:
         mcp.run(transport=args.transport, host=args.host, port=args.port)
 
@@ -1,15 +1,129 @@
 """API server management and request polling tools."""
 
-import json
+import asyncio
+import collections
+import contextlib
+import functools
+import threading
+import time
 
-import sky
+import pydantic
+from fastmcp import Context
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _dumps,
+    _submitted_response,
+    aresolve_request,
+    capture_api_server_logs,
     handle_skypilot_error,
-    resolve_request,
     safe_json_serialize,
+    sky,
 )
+from skypilot_mcp.tools.infra import invalidate_catalog_cache
+
+# Responses of tools whose output never varies, encoded once at import.
+_API_STARTED_RESPONSE = _dumps({"message": "API server started."})
+_API_STOPPED_RESPONSE = _dumps({"message": "API server stopped."})
+_LOGGED_IN_RESPONSE = _dumps({"message": "Logged in to API server."})
+_LOGGED_OUT_RESPONSE = _dumps({"message": "Logged out of API server."})
+
+# Maximum number of log chunks (normally one per line) that
+# skypilot_stream_and_get keeps in memory; older output is dropped.
+STREAM_LOG_MAX_CHUNKS = 10_000
+
+# Minimum seconds between two progress notifications of one
+# skypilot_stream_and_get call. Lines logged in between are sent together.
+PROGRESS_MIN_INTERVAL = 0.5
+
+
+class _ProgressStream:
+    """Write-only stream for sky.stream_and_get output.
+
+    Keeps a bounded tail of the log output and, when a tool Context is
+    given, forwards complete log lines to the MCP client as progress
+    notifications, at most one every PROGRESS_MIN_INTERVAL seconds; lines
+    logged in between are joined into one message. ``write`` is called
+    from the SDK's worker thread, so it only queues lines and schedules a
+    flush, which sends the notification from the event loop thread.
+    """
+
+    def __init__(self, ctx: Context | None, loop: asyncio.AbstractEventLoop):
+        self.tail: collections.deque[str] = collections.deque(
+            maxlen=STREAM_LOG_MAX_CHUNKS
+        )
+        self._ctx = ctx
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._partial = ""
+        self._pending: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_scheduled = False
+        self._next_flush = 0.0
+        self._count = 0
+        self._last_notification: asyncio.Task | None = None
+
+    def write(self, s: str) -> int:
+        if s:
+            self.tail.append(s)
+            if self._ctx is not None:
+                self._queue_lines(s)
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.tail)
+
+    def _queue_lines(self, s: str) -> None:
+        with self._lock:
+            # Queue complete lines only, however the writes are split.
+            *lines, self._partial = (self._partial + s).split("\n")
+            if not lines:
+                return
+            self._pending.extend(lines)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            delay = max(self._next_flush - time.monotonic(), 0)
+        self._loop.call_soon_threadsafe(self._schedule_flush, delay)
+
+    def _schedule_flush(self, delay: float) -> None:
+        self._flush_handle = self._loop.call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        with self._lock:
+            lines, self._pending = self._pending, []
+            self._flush_scheduled = False
+            self._next_flush = time.monotonic() + PROGRESS_MIN_INTERVAL
+        if lines:
+            self._count += len(lines)
+            self._last_notification = asyncio.ensure_future(
+                self._notify(self._last_notification, self._count, "\n".join(lines))
+            )
+
+    async def _notify(self, previous, count: int, message: str) -> None:
+        # Wait for the previous notification so they reach the client in order.
+        if previous is not None:
+            with contextlib.suppress(Exception):
+                await previous
+        await self._ctx.report_progress(count, message=message)
+
+    async def drain(self) -> None:
+        """Send any queued or unterminated lines and wait until they are sent."""
+        if self._ctx is None:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        with self._lock:
+            if self._partial:
+                self._pending.append(self._partial)
+                self._partial = ""
+        self._flush()
+        if self._last_notification is not None:
+            with contextlib.suppress(Exception):
+                await self._last_notification
 
 
 @mcp.tool(
@@ -22,9 +136,9 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_info() -> str:
+async def skypilot_api_info() -> str:
     """Get API server info."""
-    info = sky.api_info()
+    info = await asyncio.to_thread(sky.api_info)
     return safe_json_serialize(info)
 
 
@@ -40,7 +154,7 @@ def skypilot_api_info() -> str:
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_status(
+async def skypilot_api_status(
     request_ids: list[str] | None = None,
     all_status: bool = False,
     limit: int | None = None,
@@ -48,16 +162,29 @@ def skypilot_api_status(
     cluster_name: str | None = None,
 ) -> str:
     """List API requests."""
-    result = sky.api_status(
+    result = await asyncio.to_thread(
+        sky.api_status,
         request_ids=request_ids,
         all_status=all_status,
         limit=limit,
         fields=fields,
         cluster_name=cluster_name,
     )
+    adapter, payload_cls = _request_payload_list_adapter()
+    if isinstance(result, list) and all(type(r) is payload_cls for r in result):
+        # Known schema of primitive fields: encode in a single pydantic-core
+        # call instead of dumping each model and walking the dicts.
+        return adapter.dump_json(result, indent=2).decode()
     return safe_json_serialize(result)
 
 
+@functools.lru_cache(maxsize=1)
+def _request_payload_list_adapter():
+    from sky.server.requests.payloads import RequestPayload
+
+    return pydantic.TypeAdapter(list[RequestPayload]), RequestPayload
+
+
 @mcp.tool(
     name="skypilot_api_cancel",
     description=(
@@ -68,18 +195,15 @@ def skypilot_api_status(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_cancel(
+async def skypilot_api_cancel(
     request_ids: list[str] | None = None,
     all_users: bool = False,
 ) -> str:
     """Cancel API requests."""
-    request_id = sky.api_cancel(request_ids=request_ids, all_users=all_users)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "API cancel request submitted.",
-        }
+    request_id = await asyncio.to_thread(
+        sky.api_cancel, request_ids=request_ids, all_users=all_users
     )
+    return _submitted_response(request_id, "API cancel request submitted.")
 
 
 @mcp.tool(
@@ -95,9 +219,9 @@ def skypilot_api_cancel(
     timeout=600,
 )
 @handle_skypilot_error
-def skypilot_get_request(request_id: str) -> str:
+async def skypilot_get_request(request_id: str) -> str:
     """Wait for and return the result of a SkyPilot request."""
-    result = resolve_request(request_id)
+    result = await aresolve_request(request_id)
     return safe_json_serialize(result)
 
 
@@ -109,8 +233,11 @@ def skypilot_get_request(request_id: str) -> str:
         "result), this also returns the streaming logs produced during "
         "execution — useful for long-running operations like launch, exec, "
         "or managed job launch. Returns a JSON object with 'result' and "
-        "'logs' fields. Set tail to limit how many trailing log lines are "
-        "captured (default: all). Set follow=False to return immediately "
+        "'logs' fields; log lines are also sent as progress notifications "
+        "while the request runs. Set tail to limit how many trailing log "
+        "lines are captured (default: all). The response keeps at most the "
+        "last 10000 chunks of log output (normally one line each). "
+        "Set follow=False to return immediately "
         "with whatever logs are available. Use log_path instead of "
         "request_id to stream from a specific log file on the API server."
     ),
@@ -119,27 +246,28 @@ def skypilot_get_request(request_id: str) -> str:
     timeout=600,
 )
 @handle_skypilot_error
-def skypilot_stream_and_get(
+async def skypilot_stream_and_get(
     request_id: str,
     tail: int | None = None,
     follow: bool = True,
     log_path: str | None = None,
+    ctx: Context | None = None,
 ) -> str:
     """Stream logs and return the result of a SkyPilot request."""
-    import io
-
-    buf = io.StringIO()
-    result = sky.stream_and_get(
+    stream = _ProgressStream(ctx, asyncio.get_running_loop())
+    result = await asyncio.to_thread(
+        sky.stream_and_get,
         request_id,
         log_path=log_path,
         follow=follow,
         tail=tail,
-        output_stream=buf,
+        output_stream=stream,
     )
+    await stream.drain()
     return safe_json_serialize(
         {
             "result": result,
-            "logs": buf.getvalue(),
+            "logs": stream.getvalue(),
         }
     )
 
@@ -156,7 +284,7 @@ def skypilot_stream_and_get(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_start(
+async def skypilot_api_start(
     deploy: bool = False,
     host: str = "127.0.0.1",
     metrics: bool = False,
@@ -164,7 +292,8 @@ def skypilot_api_start(
     enable_basic_auth: bool = False,
 ) -> str:
     """Start the API server."""
-    sky.api_start(
+    await asyncio.to_thread(
+        sky.api_start,
         deploy=deploy,
         host=host,
         foreground=False,
@@ -172,7 +301,7 @@ def skypilot_api_start(
         metrics_port=metrics_port,
         enable_basic_auth=enable_basic_auth,
     )
-    return json.dumps({"message": "API server started."})
+    return _API_STARTED_RESPONSE
 
 
 @mcp.tool(
@@ -185,10 +314,10 @@ def skypilot_api_start(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_stop() -> str:
+async def skypilot_api_stop() -> str:
     """Stop the API server."""
-    sky.api_stop()
-    return json.dumps({"message": "API server stopped."})
+    await asyncio.to_thread(sky.api_stop)
+    return _API_STOPPED_RESPONSE
 
 
 @mcp.tool(
@@ -201,26 +330,11 @@ def skypilot_api_stop() -> str:
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_server_logs(
+async def skypilot_api_server_logs(
     tail: int | None = 100,
 ) -> str:
     """Get API server logs."""
-    import contextlib
-    import io
-
-    from skypilot_mcp.helpers import _STDOUT_REDIRECT_LOCK
-
-    buf = io.StringIO()
-    # api_server_logs does not accept output_stream, so redirect both
-    # stdout and stderr to capture all output reliably.  The lock
-    # prevents concurrent tool calls from interleaving output.
-    with (
-        _STDOUT_REDIRECT_LOCK,
-        contextlib.redirect_stdout(buf),
-        contextlib.redirect_stderr(buf),
-    ):
-        sky.api_server_logs(follow=False, tail=tail)
-    return buf.getvalue()
+    return await asyncio.to_thread(capture_api_server_logs, tail)
 
 
 @mcp.tool(
@@ -234,18 +348,22 @@ def skypilot_api_server_logs(
     annotations={"destructiveHint": False},
 )
 @handle_skypilot_error
-def skypilot_api_login(
+async def skypilot_api_login(
     endpoint: str | None = None,
     relogin: bool = False,
     service_account_token: str | None = None,
 ) -> str:
     """Log in to API server."""
-    sky.api_login(
-        endpoint=endpoint,
-        relogin=relogin,
-        service_account_token=service_account_token,
-    )
-    return json.dumps({"message": "Logged in to API server."})
+    try:
+        await asyncio.to_thread(
+            sky.api_login,
+            endpoint=endpoint,
+            relogin=relogin,
+            service_account_token=service_account_token,
+        )
+    finally:
+        invalidate_catalog_cache()
+    return _LOGGED_IN_RESPONSE
 
 
 @mcp.tool(
@@ -258,7 +376,10 @@ def skypilot_api_login(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_api_logout() -> str:
+async def skypilot_api_logout() -> str:
     """Log out of API server."""
-    sky.api_logout()
-    return json.dumps({"message": "Logged out of API server."})
+    try:
+        await asyncio.to_thread(sky.api_logout)
+    finally:
+        invalidate_catalog_cache()
+    return _LOGGED_OUT_RESPONSE
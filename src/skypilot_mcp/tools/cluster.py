@@ -1,17 +1,19 @@
 """Cluster lifecycle management tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
     _parse_optimize_target,
     _parse_status_refresh_mode,
+    _parse_wait_for,
+    _submitted_response,
+    aresolve_request,
+    aresolve_requests,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
     safe_json_serialize,
+    sky,
 )
 
 
@@ -22,28 +24,64 @@ from skypilot_mcp.helpers import (
         "resource types, autostop settings, and more. "
         "If no cluster_names provided, returns all clusters. "
         "Set refresh to 'NONE' (default, no refresh), 'AUTO' (refresh only "
-        "clusters with autostop or spot instances), or 'FORCE' (refresh all)."
+        "clusters with autostop or spot instances), or 'FORCE' (refresh all). "
+        "Set wait=False to return a request_id immediately instead of waiting "
+        "for the result; use skypilot_get_request to fetch it."
     ),
     tags={"cluster"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_status(
+async def skypilot_cluster_status(
     cluster_names: list[str] | None = None,
     refresh: str = "NONE",
     all_users: bool = False,
+    wait: bool = True,
 ) -> str:
     """Get cluster statuses."""
     refresh_mode = _parse_status_refresh_mode(refresh)
-    request_id = sky.status(
+    request_id = await asyncio.to_thread(
+        sky.status,
         cluster_names=cluster_names,
         refresh=refresh_mode,
         all_users=all_users,
     )
-    result = resolve_request(request_id)
+    if not wait:
+        return _submitted_response(
+            request_id,
+            "Status request submitted. Use skypilot_get_request to get the result.",
+        )
+    result = await aresolve_request(request_id)
     return safe_json_serialize(result)
 
 
+@mcp.tool(
+    name="skypilot_overview",
+    description=(
+        "Get an overview of SkyPilot usage in one call: the status of all "
+        "clusters and their cost report. Equivalent to skypilot_cluster_status "
+        "plus skypilot_cost_report, but both requests are waited on together. "
+        "Optionally limit the cost report to the last N days."
+    ),
+    tags={"cluster", "cost"},
+    annotations={"readOnlyHint": True},
+)
+@handle_skypilot_error
+async def skypilot_overview(
+    days: int | None = None,
+    all_users: bool = False,
+) -> str:
+    """Get cluster statuses and cost reports together."""
+    status_id, cost_id = await asyncio.gather(
+        asyncio.to_thread(sky.status, all_users=all_users),
+        asyncio.to_thread(sky.cost_report, days=days),
+    )
+    results = await aresolve_requests([status_id, cost_id])
+    return safe_json_serialize(
+        {"clusters": results[status_id], "cost_report": results[cost_id]}
+    )
+
+
 @mcp.tool(
     name="skypilot_cluster_launch",
     description=(
@@ -59,7 +97,7 @@ def skypilot_cluster_status(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_launch(
+async def skypilot_cluster_launch(
     task_yaml: str,
     cluster_name: str | None = None,
     retry_until_up: bool = False,
@@ -74,7 +112,7 @@ def skypilot_cluster_launch(
 ) -> str:
     """Launch a cluster with a task."""
     target = _parse_optimize_target(optimize_target)
-    dag = load_dag_from_yaml(task_yaml)
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
 
     kwargs: dict = dict(
         cluster_name=cluster_name,
@@ -88,17 +126,13 @@ def skypilot_cluster_launch(
         optimize_target=target,
     )
     if wait_for is not None:
-        from sky.skylet.autostop_lib import AutostopWaitFor
+        kwargs["wait_for"] = _parse_wait_for(wait_for)
 
-        kwargs["wait_for"] = AutostopWaitFor(wait_for)
-
-    request_id = sky.launch(dag, **kwargs)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Launch request submitted. Use skypilot_get_request to check status.",
-        }
+    request_id = await asyncio.to_thread(sky.launch, dag, **kwargs)
+    return _submitted_response(
+        request_id,
+        "Launch request submitted. Use skypilot_get_request to check status.",
+        cluster_name=cluster_name,
     )
 
 
@@ -113,26 +147,25 @@ def skypilot_cluster_launch(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_exec(
+async def skypilot_cluster_exec(
     task_yaml: str,
     cluster_name: str,
     dryrun: bool = False,
     down: bool = False,
 ) -> str:
     """Execute a task on an existing cluster."""
-    dag = load_dag_from_yaml(task_yaml)
-    request_id = sky.exec(
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    request_id = await asyncio.to_thread(
+        sky.exec,
         dag,
         cluster_name=cluster_name,
         dryrun=dryrun,
         down=down,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Exec request submitted. Use skypilot_get_request to check status.",
-        }
+    return _submitted_response(
+        request_id,
+        "Exec request submitted. Use skypilot_get_request to check status.",
+        cluster_name=cluster_name,
     )
 
 
@@ -148,25 +181,22 @@ def skypilot_cluster_exec(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_stop(
+async def skypilot_cluster_stop(
     cluster_name: str,
     purge: bool = False,
     graceful: bool = False,
     graceful_timeout: int | None = None,
 ) -> str:
     """Stop a cluster."""
-    request_id = sky.stop(
+    request_id = await asyncio.to_thread(
+        sky.stop,
         cluster_name,
         purge=purge,
         graceful=graceful,
         graceful_timeout=graceful_timeout,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Stop request submitted.",
-        }
+    return _submitted_response(
+        request_id, "Stop request submitted.", cluster_name=cluster_name
     )
 
 
@@ -182,7 +212,7 @@ def skypilot_cluster_stop(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_start(
+async def skypilot_cluster_start(
     cluster_name: str,
     idle_minutes_to_autostop: int | None = None,
     wait_for: str | None = None,
@@ -198,17 +228,11 @@ def skypilot_cluster_start(
         force=force,
     )
     if wait_for is not None:
-        from sky.skylet.autostop_lib import AutostopWaitFor
-
-        kwargs["wait_for"] = AutostopWaitFor(wait_for)
+        kwargs["wait_for"] = _parse_wait_for(wait_for)
 
-    request_id = sky.start(cluster_name, **kwargs)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Start request submitted.",
-        }
+    request_id = await asyncio.to_thread(sky.start, cluster_name, **kwargs)
+    return _submitted_response(
+        request_id, "Start request submitted.", cluster_name=cluster_name
     )
 
 
@@ -222,21 +246,18 @@ def skypilot_cluster_start(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_down(
+async def skypilot_cluster_down(
     cluster_name: str,
     purge: bool = False,
 ) -> str:
     """Tear down a cluster."""
-    request_id = sky.down(
+    request_id = await asyncio.to_thread(
+        sky.down,
         cluster_name,
         purge=purge,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Down request submitted.",
-        }
+    return _submitted_response(
+        request_id, "Down request submitted.", cluster_name=cluster_name
     )
 
 
@@ -255,7 +276,7 @@ def skypilot_cluster_down(
     annotations={"idempotentHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_autostop(
+async def skypilot_cluster_autostop(
     cluster_name: str,
     idle_minutes: int,
     wait_for: str | None = None,
@@ -266,21 +287,17 @@ def skypilot_cluster_autostop(
     """Set autostop for a cluster."""
     kwargs: dict = dict(idle_minutes=idle_minutes, down=down)
     if wait_for is not None:
-        from sky.skylet.autostop_lib import AutostopWaitFor
-
-        kwargs["wait_for"] = AutostopWaitFor(wait_for)
+        kwargs["wait_for"] = _parse_wait_for(wait_for)
     if hook is not None:
         kwargs["hook"] = hook
     if hook_timeout is not None:
         kwargs["hook_timeout"] = hook_timeout
 
-    request_id = sky.autostop(cluster_name, **kwargs)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": f"Autostop set to {idle_minutes} minutes.",
-        }
+    request_id = await asyncio.to_thread(sky.autostop, cluster_name, **kwargs)
+    return _submitted_response(
+        request_id,
+        f"Autostop set to {idle_minutes} minutes.",
+        cluster_name=cluster_name,
     )
 
 
@@ -288,17 +305,26 @@ def skypilot_cluster_autostop(
     name="skypilot_cluster_endpoints",
     description=(
         "Get the endpoint(s) for a cluster. Optionally filter by port number "
-        "or port name. Returns a mapping of port numbers to endpoint URLs."
+        "or port name. Returns a mapping of port numbers to endpoint URLs. "
+        "Set wait=False to return a request_id immediately instead of waiting "
+        "for the result; use skypilot_get_request to fetch it."
     ),
     tags={"cluster"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_cluster_endpoints(
+async def skypilot_cluster_endpoints(
     cluster_name: str,
     port: int | str | None = None,
+    wait: bool = True,
 ) -> str:
     """Get cluster endpoints."""
-    request_id = sky.endpoints(cluster_name, port=port)
-    result = resolve_request(request_id)
+    request_id = await asyncio.to_thread(sky.endpoints, cluster_name, port=port)
+    if not wait:
+        return _submitted_response(
+            request_id,
+            "Endpoints request submitted. Use skypilot_get_request to get the result.",
+            cluster_name=cluster_name,
+        )
+    result = await aresolve_request(request_id)
     return safe_json_serialize(result)
@@ -1,15 +1,13 @@
 """Configuration and utility tools."""
 
-import json
-
-import sky
-from sky.client.sdk import dashboard as sky_dashboard
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _dumps,
+    arun_and_serialize,
     handle_skypilot_error,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -24,10 +22,10 @@ from skypilot_mcp.helpers import (
     annotations={"idempotentHint": True},
 )
 @handle_skypilot_error
-def skypilot_reload_config() -> str:
+async def skypilot_reload_config() -> str:
     """Reload SkyPilot configuration."""
-    sky.reload_config()
-    return json.dumps({"message": "Configuration reloaded."})
+    await asyncio.to_thread(sky.reload_config)
+    return _dumps({"message": "Configuration reloaded."})
 
 
 @mcp.tool(
@@ -40,11 +38,9 @@ def skypilot_reload_config() -> str:
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_workspaces() -> str:
+async def skypilot_workspaces() -> str:
     """Get workspaces."""
-    request_id = sky.workspaces()
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.workspaces)
 
 
 @mcp.tool(
@@ -57,12 +53,14 @@ def skypilot_workspaces() -> str:
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_dashboard(
+async def skypilot_dashboard(
     starting_page: str | None = None,
 ) -> str:
     """Open the SkyPilot dashboard."""
-    sky_dashboard(starting_page=starting_page)
-    return json.dumps({"message": "Dashboard opened in browser."})
+    from sky.client.sdk import dashboard
+
+    await asyncio.to_thread(dashboard, starting_page=starting_page)
+    return _dumps({"message": "Dashboard opened in browser."})
 
 
 @mcp.tool(
@@ -75,7 +73,7 @@ def skypilot_dashboard(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_jobs_dashboard() -> str:
+async def skypilot_jobs_dashboard() -> str:
     """Open the jobs dashboard."""
-    sky.jobs.dashboard()
-    return json.dumps({"message": "Jobs dashboard opened in browser."})
+    await asyncio.to_thread(sky.jobs.dashboard)
+    return _dumps({"message": "Jobs dashboard opened in browser."})
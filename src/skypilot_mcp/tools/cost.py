@@ -1,12 +1,13 @@
 """Cost reporting tools."""
 
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    aresolve_request,
     handle_skypilot_error,
-    resolve_request,
-    safe_json_serialize,
+    safe_json_serialize_records,
+    sky,
 )
 
 
@@ -21,10 +22,10 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_cost_report(
+async def skypilot_cost_report(
     days: int | None = None,
 ) -> str:
     """Get cluster cost reports."""
-    request_id = sky.cost_report(days=days)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    request_id = await asyncio.to_thread(sky.cost_report, days=days)
+    result = await aresolve_request(request_id)
+    return safe_json_serialize_records(result)
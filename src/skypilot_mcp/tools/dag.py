@@ -1,16 +1,15 @@
 """DAG optimization and validation tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _dumps,
     _parse_optimize_target,
+    arun_and_serialize,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -26,16 +25,14 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_optimize(
+async def skypilot_optimize(
     task_yaml: str,
     minimize: str = "COST",
 ) -> str:
     """Optimize a task DAG."""
     target = _parse_optimize_target(minimize)
-    dag = load_dag_from_yaml(task_yaml)
-    request_id = sky.optimize(dag, minimize=target)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    return await arun_and_serialize(sky.optimize, dag, minimize=target)
 
 
 @mcp.tool(
@@ -50,11 +47,11 @@ def skypilot_optimize(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_validate(
+async def skypilot_validate(
     task_yaml: str,
     workdir_only: bool = False,
 ) -> str:
     """Validate a task DAG."""
-    dag = load_dag_from_yaml(task_yaml)
-    sky.validate(dag, workdir_only=workdir_only)
-    return json.dumps({"status": "valid", "message": "Task validation passed."})
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    await asyncio.to_thread(sky.validate, dag, workdir_only=workdir_only)
+    return _dumps({"status": "valid", "message": "Task validation passed."})
@@ -1,16 +1,60 @@
 """Infrastructure and cloud resource tools."""
 
-import json
-
-import sky
+import asyncio
+import time
+from typing import Any
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _submitted_response,
+    aresolve_request,
+    arun_and_serialize,
     handle_skypilot_error,
-    resolve_request,
     safe_json_serialize,
+    safe_json_serialize_records,
+    sky,
 )
 
+# Catalog queries (enabled clouds, accelerators) change on the order of
+# minutes, so their serialized responses are reused for CATALOG_CACHE_TTL
+# seconds. Keys are (API server URL, tool name, *arguments); the oldest entry
+# is evicted once CATALOG_CACHE_SIZE entries are stored. Pass refresh=True to
+# bypass. skypilot_check and the api_login/api_logout tools clear the cache,
+# since they change which clouds are enabled or which server is queried.
+CATALOG_CACHE_TTL = 300
+CATALOG_CACHE_SIZE = 128
+_CATALOG_CACHE: dict[tuple, tuple[float, str]] = {}
+
+
+def invalidate_catalog_cache() -> None:
+    """Drop every cached catalog response."""
+    _CATALOG_CACHE.clear()
+
+
+async def _catalog_key(*parts: Any) -> tuple:
+    """Return the cache key of a catalog query to the current API server."""
+    server_url = await asyncio.to_thread(sky.server.common.get_server_url)
+    return (server_url, *parts)
+
+
+def _cached_catalog_response(key: tuple) -> str | None:
+    entry = _CATALOG_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if time.monotonic() >= expires_at:
+        del _CATALOG_CACHE[key]
+        return None
+    return response
+
+
+def _store_catalog_response(key: tuple, response: str) -> str:
+    _CATALOG_CACHE.pop(key, None)
+    _CATALOG_CACHE[key] = (time.monotonic() + CATALOG_CACHE_TTL, response)
+    while len(_CATALOG_CACHE) > CATALOG_CACHE_SIZE:
+        del _CATALOG_CACHE[next(iter(_CATALOG_CACHE))]
+    return response
+
 
 @mcp.tool(
     name="skypilot_check",
@@ -25,16 +69,20 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_check(
+async def skypilot_check(
     infra: list[str] | None = None,
     verbose: bool = False,
     workspace: str | None = None,
 ) -> str:
     """Check infrastructure credentials."""
     infra_tuple = tuple(infra) if infra is not None else None
-    request_id = sky.check(infra_list=infra_tuple, verbose=verbose, workspace=workspace)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    try:
+        return await arun_and_serialize(
+            sky.check, infra_list=infra_tuple, verbose=verbose, workspace=workspace
+        )
+    finally:
+        # The check may have enabled or disabled clouds.
+        invalidate_catalog_cache()
 
 
 @mcp.tool(
@@ -43,20 +91,27 @@ def skypilot_check(
         "List all clouds that have been enabled (credentials configured). "
         "Returns a list of cloud names. Set expand=True to expand Kubernetes "
         "and SSH into individual resource pools. Optionally specify a workspace "
-        "name to scope the listing to a specific workspace."
+        "name to scope the listing to a specific workspace. Results are "
+        "cached for 5 minutes; set refresh=True to query the server again."
     ),
     tags={"infra"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_enabled_clouds(
+async def skypilot_enabled_clouds(
     expand: bool = False,
     workspace: str | None = None,
+    refresh: bool = False,
 ) -> str:
     """Get enabled clouds."""
-    request_id = sky.enabled_clouds(expand=expand, workspace=workspace)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    key = await _catalog_key("enabled_clouds", expand, workspace)
+    if not refresh and (cached := _cached_catalog_response(key)) is not None:
+        return cached
+    request_id = await asyncio.to_thread(
+        sky.enabled_clouds, expand=expand, workspace=workspace
+    )
+    result = await aresolve_request(request_id)
+    return _store_catalog_response(key, safe_json_serialize(result))
 
 
 @mcp.tool(
@@ -65,13 +120,15 @@ def skypilot_enabled_clouds(
         "List available accelerators (GPUs/TPUs) across clouds. "
         "Filter by name, region, quantity, or specific clouds. "
         "Set gpus_only=False to include non-GPU accelerators like TPUs. "
-        "Set case_sensitive=False for case-insensitive name filtering."
+        "Set case_sensitive=False for case-insensitive name filtering. "
+        "Results are cached for 5 minutes; set refresh=True to query the "
+        "server again."
     ),
     tags={"infra"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_list_accelerators(
+async def skypilot_list_accelerators(
     gpus_only: bool = True,
     name_filter: str | None = None,
     region_filter: str | None = None,
@@ -80,9 +137,24 @@ def skypilot_list_accelerators(
     all_regions: bool = False,
     require_price: bool = True,
     case_sensitive: bool = True,
+    refresh: bool = False,
 ) -> str:
     """List available accelerators."""
-    request_id = sky.list_accelerators(
+    key = await _catalog_key(
+        "list_accelerators",
+        gpus_only,
+        name_filter,
+        region_filter,
+        quantity_filter,
+        tuple(clouds or ()),
+        all_regions,
+        require_price,
+        case_sensitive,
+    )
+    if not refresh and (cached := _cached_catalog_response(key)) is not None:
+        return cached
+    request_id = await asyncio.to_thread(
+        sky.list_accelerators,
         gpus_only=gpus_only,
         name_filter=name_filter,
         region_filter=region_filter,
@@ -92,8 +164,8 @@ def skypilot_list_accelerators(
         require_price=require_price,
         case_sensitive=case_sensitive,
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    result = await aresolve_request(request_id)
+    return _store_catalog_response(key, safe_json_serialize_records(result))
 
 
 @mcp.tool(
@@ -101,29 +173,43 @@ def skypilot_list_accelerators(
     description=(
         "List available accelerators and their available counts. "
         "Returns a mapping of accelerator names to available quantities. "
-        "Filter by name, region, quantity, or specific clouds."
+        "Filter by name, region, quantity, or specific clouds. "
+        "Results are cached for 5 minutes; set refresh=True to query the "
+        "server again."
     ),
     tags={"infra"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_list_accelerator_counts(
+async def skypilot_list_accelerator_counts(
     gpus_only: bool = True,
     name_filter: str | None = None,
     region_filter: str | None = None,
     quantity_filter: int | None = None,
     clouds: list[str] | None = None,
+    refresh: bool = False,
 ) -> str:
     """List available accelerator counts."""
-    request_id = sky.list_accelerator_counts(
+    key = await _catalog_key(
+        "list_accelerator_counts",
+        gpus_only,
+        name_filter,
+        region_filter,
+        quantity_filter,
+        tuple(clouds or ()),
+    )
+    if not refresh and (cached := _cached_catalog_response(key)) is not None:
+        return cached
+    request_id = await asyncio.to_thread(
+        sky.list_accelerator_counts,
         gpus_only=gpus_only,
         name_filter=name_filter,
         region_filter=region_filter,
         quantity_filter=quantity_filter,
         clouds=clouds,
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    result = await aresolve_request(request_id)
+    return _store_catalog_response(key, safe_json_serialize(result))
 
 
 @mcp.tool(
@@ -136,13 +222,11 @@ def skypilot_list_accelerator_counts(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_kubernetes_node_info(
+async def skypilot_kubernetes_node_info(
     context: str | None = None,
 ) -> str:
     """Get Kubernetes node info."""
-    request_id = sky.kubernetes_node_info(context=context)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.kubernetes_node_info, context=context)
 
 
 @mcp.tool(
@@ -158,21 +242,20 @@ def skypilot_kubernetes_node_info(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_realtime_gpu_availability(
+async def skypilot_realtime_gpu_availability(
     context: str | None = None,
     name_filter: str | None = None,
     quantity_filter: int | None = None,
     is_ssh: bool | None = None,
 ) -> str:
     """Get real-time Kubernetes GPU availability."""
-    request_id = sky.realtime_kubernetes_gpu_availability(
+    return await arun_and_serialize(
+        sky.realtime_kubernetes_gpu_availability,
         context=context,
         name_filter=name_filter,
         quantity_filter=quantity_filter,
         is_ssh=is_ssh,
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
 
 
 @mcp.tool(
@@ -186,23 +269,19 @@ def skypilot_realtime_gpu_availability(
     annotations={"destructiveHint": False},
 )
 @handle_skypilot_error
-def skypilot_kubernetes_label_gpus(
+async def skypilot_kubernetes_label_gpus(
     context: str | None = None,
     cleanup_only: bool = False,
     wait_for_completion: bool = True,
 ) -> str:
     """Label Kubernetes GPU nodes."""
-    request_id = sky.kubernetes_label_gpus(
+    request_id = await asyncio.to_thread(
+        sky.kubernetes_label_gpus,
         context=context,
         cleanup_only=cleanup_only,
         wait_for_completion=wait_for_completion,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Kubernetes GPU labeling request submitted.",
-        }
-    )
+    return _submitted_response(request_id, "Kubernetes GPU labeling request submitted.")
 
 
 @mcp.tool(
@@ -216,26 +295,22 @@ def skypilot_kubernetes_label_gpus(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_status_kubernetes() -> str:
+async def skypilot_status_kubernetes() -> str:
     """Get Kubernetes cluster status."""
-    request_id = sky.status_kubernetes()
-    result = resolve_request(request_id)
-    # Unpack defensively in case the return format changes.
-    if isinstance(result, (list, tuple)) and len(result) >= 4:
-        clusters, other_clusters, managed_jobs, context = (
-            result[0],
-            result[1],
-            result[2],
-            result[3],
-        )
-        return safe_json_serialize(
-            {
-                "clusters": clusters,
-                "other_clusters": other_clusters,
-                "managed_jobs": managed_jobs,
-                "context": context,
-            }
-        )
+    request_id = await asyncio.to_thread(sky.status_kubernetes)
+    result = await aresolve_request(request_id)
+    # Unpack defensively in case the return format changes. Sequence
+    # patterns never match str or dict results, which fall through as-is.
+    match result:
+        case [clusters, other_clusters, managed_jobs, context, *_]:
+            return safe_json_serialize(
+                {
+                    "clusters": clusters,
+                    "other_clusters": other_clusters,
+                    "managed_jobs": managed_jobs,
+                    "context": context,
+                }
+            )
     return safe_json_serialize(result)
 
 
@@ -250,19 +325,16 @@ def skypilot_status_kubernetes() -> str:
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_local_up(
+async def skypilot_local_up(
     gpus: bool = False,
     name: str | None = None,
     port_start: int | None = None,
 ) -> str:
     """Launch a local Kubernetes cluster."""
-    request_id = sky.local_up(gpus=gpus, name=name, port_start=port_start)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Local cluster launch submitted.",
-        }
+    request_id = await asyncio.to_thread(
+        sky.local_up, gpus=gpus, name=name, port_start=port_start
     )
+    return _submitted_response(request_id, "Local cluster launch submitted.")
 
 
 @mcp.tool(
@@ -275,17 +347,12 @@ def skypilot_local_up(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_local_down(
+async def skypilot_local_down(
     name: str | None = None,
 ) -> str:
     """Tear down a local Kubernetes cluster."""
-    request_id = sky.local_down(name=name)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Local cluster teardown submitted.",
-        }
-    )
+    request_id = await asyncio.to_thread(sky.local_down, name=name)
+    return _submitted_response(request_id, "Local cluster teardown submitted.")
 
 
 @mcp.tool(
@@ -299,18 +366,13 @@ def skypilot_local_down(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_ssh_up(
+async def skypilot_ssh_up(
     infra: str | None = None,
     file: str | None = None,
 ) -> str:
     """Deploy SSH node pools."""
-    request_id = sky.ssh_up(infra=infra, file=file)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "SSH node pool deployment submitted.",
-        }
-    )
+    request_id = await asyncio.to_thread(sky.ssh_up, infra=infra, file=file)
+    return _submitted_response(request_id, "SSH node pool deployment submitted.")
 
 
 @mcp.tool(
@@ -323,17 +385,12 @@ def skypilot_ssh_up(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_ssh_down(
+async def skypilot_ssh_down(
     infra: str | None = None,
 ) -> str:
     """Tear down SSH node pools."""
-    request_id = sky.ssh_down(infra=infra)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "SSH node pool teardown submitted.",
-        }
-    )
+    request_id = await asyncio.to_thread(sky.ssh_down, infra=infra)
+    return _submitted_response(request_id, "SSH node pool teardown submitted.")
 
 
 @mcp.tool(
@@ -347,19 +404,18 @@ def skypilot_ssh_down(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_realtime_slurm_gpu_availability(
+async def skypilot_realtime_slurm_gpu_availability(
     name_filter: str | None = None,
     quantity_filter: int | None = None,
     slurm_cluster_name: str | None = None,
 ) -> str:
     """Get real-time Slurm GPU availability."""
-    request_id = sky.realtime_slurm_gpu_availability(
+    return await arun_and_serialize(
+        sky.realtime_slurm_gpu_availability,
         name_filter=name_filter,
         quantity_filter=quantity_filter,
         slurm_cluster_name=slurm_cluster_name,
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
 
 
 @mcp.tool(
@@ -373,10 +429,10 @@ def skypilot_realtime_slurm_gpu_availability(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_slurm_node_info(
+async def skypilot_slurm_node_info(
     slurm_cluster_name: str | None = None,
 ) -> str:
     """Get Slurm node info."""
-    request_id = sky.slurm_node_info(slurm_cluster_name=slurm_cluster_name)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(
+        sky.slurm_node_info, slurm_cluster_name=slurm_cluster_name
+    )
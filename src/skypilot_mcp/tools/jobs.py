@@ -1,15 +1,15 @@
 """Cluster job management tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _require_exactly_one,
+    _submitted_response,
+    arun_and_serialize,
     capture_cluster_logs,
     handle_skypilot_error,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -23,17 +23,15 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_job_queue(
+async def skypilot_job_queue(
     cluster_name: str,
     skip_finished: bool = False,
     all_users: bool = False,
 ) -> str:
     """Get the job queue of a cluster."""
-    request_id = sky.queue(
-        cluster_name, skip_finished=skip_finished, all_users=all_users
+    return await arun_and_serialize(
+        sky.queue, cluster_name, skip_finished=skip_finished, all_users=all_users
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
 
 
 @mcp.tool(
@@ -46,14 +44,12 @@ def skypilot_job_queue(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_job_status(
+async def skypilot_job_status(
     cluster_name: str,
     job_ids: list[int] | None = None,
 ) -> str:
     """Get job statuses."""
-    request_id = sky.job_status(cluster_name, job_ids=job_ids)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.job_status, cluster_name, job_ids=job_ids)
 
 
 @mcp.tool(
@@ -67,26 +63,19 @@ def skypilot_job_status(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_job_cancel(
+async def skypilot_job_cancel(
     cluster_name: str,
     job_ids: list[int] | None = None,
     cancel_all: bool = False,
     all_users: bool = False,
 ) -> str:
     """Cancel jobs on a cluster."""
-    if cancel_all and job_ids:
-        raise ValueError("Specify either job_ids or cancel_all=True, not both.")
-    if not cancel_all and not job_ids:
-        raise ValueError("Specify job_ids or set cancel_all=True.")
-    request_id = sky.cancel(
-        cluster_name, all=cancel_all, all_users=all_users, job_ids=job_ids
+    _require_exactly_one(job_ids=job_ids, cancel_all=cancel_all)
+    request_id = await asyncio.to_thread(
+        sky.cancel, cluster_name, all=cancel_all, all_users=all_users, job_ids=job_ids
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "cluster_name": cluster_name,
-            "message": "Cancel request submitted.",
-        }
+    return _submitted_response(
+        request_id, "Cancel request submitted.", cluster_name=cluster_name
     )
 
 
@@ -102,10 +91,12 @@ def skypilot_job_cancel(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_job_logs(
+async def skypilot_job_logs(
     cluster_name: str,
     job_id: int | None = None,
     tail: int = 100,
 ) -> str:
     """Get job logs."""
-    return capture_cluster_logs(cluster_name, job_id=job_id, tail=tail)
+    return await asyncio.to_thread(
+        capture_cluster_logs, cluster_name, job_id=job_id, tail=tail
+    )
@@ -1,13 +1,17 @@
 """Log download tools for clusters, managed jobs, services, and pools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    LOG_MAX_BYTES,
+    _BoundedListStream,
+    _dumps,
+    _tail_bytes,
+    capture_stdio,
     handle_skypilot_error,
     safe_json_serialize,
+    sky,
 )
 
 
@@ -21,12 +25,12 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_download_logs(
+async def skypilot_download_logs(
     cluster_name: str,
     job_ids: list[str] | None = None,
 ) -> str:
     """Download cluster job logs."""
-    result = sky.download_logs(cluster_name, job_ids=job_ids)
+    result = await asyncio.to_thread(sky.download_logs, cluster_name, job_ids=job_ids)
     return safe_json_serialize(result)
 
 
@@ -42,7 +46,7 @@ def skypilot_download_logs(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_download_logs(
+async def skypilot_managed_job_download_logs(
     name: str | None = None,
     job_id: int | None = None,
     refresh: bool = False,
@@ -58,7 +62,7 @@ def skypilot_managed_job_download_logs(
     )
     if local_dir is not None:
         kwargs["local_dir"] = local_dir
-    result = sky.jobs.download_logs(**kwargs)
+    result = await asyncio.to_thread(sky.jobs.download_logs, **kwargs)
     return safe_json_serialize(result)
 
 
@@ -72,7 +76,7 @@ def skypilot_managed_job_download_logs(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_download_logs(
+async def skypilot_serve_download_logs(
     service_name: str,
     local_dir: str,
     targets: list[str] | None = None,
@@ -80,14 +84,15 @@ def skypilot_serve_download_logs(
     tail: int | None = None,
 ) -> str:
     """Download service logs."""
-    sky.serve.sync_down_logs(
+    await asyncio.to_thread(
+        sky.serve.sync_down_logs,
         service_name,
         local_dir,
         targets=targets,
         replica_ids=replica_ids,
         tail=tail,
     )
-    return json.dumps(
+    return _dumps(
         {
             "service_name": service_name,
             "local_dir": local_dir,
@@ -106,7 +111,7 @@ def skypilot_serve_download_logs(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_pool_download_logs(
+async def skypilot_pool_download_logs(
     pool_name: str,
     local_dir: str,
     targets: list[str] | None = None,
@@ -114,14 +119,15 @@ def skypilot_pool_download_logs(
     tail: int | None = None,
 ) -> str:
     """Download pool logs."""
-    sky.jobs.pool_sync_down_logs(
+    await asyncio.to_thread(
+        sky.jobs.pool_sync_down_logs,
         pool_name,
         local_dir,
         targets=targets,
         worker_ids=worker_ids,
         tail=tail,
     )
-    return json.dumps(
+    return _dumps(
         {
             "pool_name": pool_name,
             "local_dir": local_dir,
@@ -142,23 +148,22 @@ def skypilot_pool_download_logs(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_tail_provision_logs(
+async def skypilot_tail_provision_logs(
     cluster_name: str,
     worker: int | None = None,
     tail: int = 100,
 ) -> str:
     """Get cluster provisioning logs."""
-    import io
-
-    buf = io.StringIO()
-    sky.tail_provision_logs(
+    buf = _BoundedListStream(LOG_MAX_BYTES)
+    await asyncio.to_thread(
+        sky.tail_provision_logs,
         cluster_name,
         worker=worker,
         follow=False,
         tail=tail,
         output_stream=buf,
     )
-    return buf.getvalue()
+    return _tail_bytes(buf.getvalue(), LOG_MAX_BYTES)
 
 
 @mcp.tool(
@@ -172,31 +177,21 @@ def skypilot_tail_provision_logs(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_tail_autostop_logs(
+async def skypilot_tail_autostop_logs(
     cluster_name: str,
     tail: int = 100,
 ) -> str:
     """Get cluster autostop logs."""
-    import contextlib
-    import io
-
-    from skypilot_mcp.helpers import _STDOUT_REDIRECT_LOCK
-
-    buf = io.StringIO()
-    # tail_autostop_logs does not accept output_stream, so redirect both
-    # stdout and stderr to capture all output reliably.  The lock
-    # prevents concurrent tool calls from interleaving output.
-    with (
-        _STDOUT_REDIRECT_LOCK,
-        contextlib.redirect_stdout(buf),
-        contextlib.redirect_stderr(buf),
-    ):
-        exit_code = sky.tail_autostop_logs(
+    # tail_autostop_logs does not accept output_stream, so capture both
+    # stdout and stderr for this call.
+    with capture_stdio(_BoundedListStream(LOG_MAX_BYTES)) as buf:
+        exit_code = await asyncio.to_thread(
+            sky.tail_autostop_logs,
             cluster_name,
             follow=False,
             tail=tail,
         )
-    output = buf.getvalue()
+    output = _tail_bytes(buf.getvalue(), LOG_MAX_BYTES)
     if exit_code:
         raise RuntimeError(
             f"Failed to retrieve autostop logs for cluster "
@@ -1,16 +1,19 @@
 """Managed job tools (auto-recovery, spot instances)."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _require_exactly_one,
+    _submitted_response,
+    aresolve_request,
+    arun_and_serialize,
     capture_managed_job_logs,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
     safe_json_serialize,
+    safe_json_serialize_records,
+    sky,
 )
 
 
@@ -27,22 +30,22 @@ from skypilot_mcp.helpers import (
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_launch(
+async def skypilot_managed_job_launch(
     task_yaml: str,
     name: str | None = None,
     pool: str | None = None,
     num_jobs: int | None = None,
 ) -> str:
     """Launch a managed job."""
-    dag = load_dag_from_yaml(task_yaml)
-    request_id = sky.jobs.launch(dag, name=name, pool=pool, num_jobs=num_jobs)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "name": name,
-            "pool": pool,
-            "message": "Managed job launch submitted. Use skypilot_get_request to check status.",
-        }
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    request_id = await asyncio.to_thread(
+        sky.jobs.launch, dag, name=name, pool=pool, num_jobs=num_jobs
+    )
+    return _submitted_response(
+        request_id,
+        "Managed job launch submitted. Use skypilot_get_request to check status.",
+        name=name,
+        pool=pool,
     )
 
 
@@ -59,7 +62,7 @@ def skypilot_managed_job_launch(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_queue(
+async def skypilot_managed_job_queue(
     refresh: bool,
     skip_finished: bool = False,
     all_users: bool = False,
@@ -70,7 +73,8 @@ def skypilot_managed_job_queue(
     sort_order: str | None = None,
 ) -> str:
     """Get managed job queue using the v2 API."""
-    request_id = sky.jobs.queue_v2(
+    request_id = await asyncio.to_thread(
+        sky.jobs.queue_v2,
         refresh=refresh,
         skip_finished=skip_finished,
         all_users=all_users,
@@ -80,25 +84,20 @@ def skypilot_managed_job_queue(
         sort_by=sort_by,
         sort_order=sort_order,
     )
-    result = resolve_request(request_id)
-    # queue_v2 returns a tuple; unpack defensively.
-    if isinstance(result, (list, tuple)) and len(result) >= 4:
-        records, total_count, status_counts, filtered_count = (
-            result[0],
-            result[1],
-            result[2],
-            result[3],
-        )
-    else:
-        return safe_json_serialize(result)
-    return safe_json_serialize(
-        {
-            "jobs": records,
-            "total_count": total_count,
-            "status_counts": status_counts,
-            "filtered_count": filtered_count,
-        }
-    )
+    result = await aresolve_request(request_id)
+    # queue_v2 returns a tuple; unpack defensively. Sequence patterns never
+    # match str or dict results, which fall through as-is.
+    match result:
+        case [records, total_count, status_counts, filtered_count, *_]:
+            return safe_json_serialize_records(
+                {
+                    "jobs": records,
+                    "total_count": total_count,
+                    "status_counts": status_counts,
+                    "filtered_count": filtered_count,
+                }
+            )
+    return safe_json_serialize(result)
 
 
 @mcp.tool(
@@ -114,21 +113,20 @@ def skypilot_managed_job_queue(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_queue_v1(
+async def skypilot_managed_job_queue_v1(
     refresh: bool,
     skip_finished: bool = False,
     all_users: bool = False,
     job_ids: list[int] | None = None,
 ) -> str:
     """Get managed job queue using the v1 API."""
-    request_id = sky.jobs.queue(
+    return await arun_and_serialize(
+        sky.jobs.queue,
         refresh=refresh,
         skip_finished=skip_finished,
         all_users=all_users,
         job_ids=job_ids,
     )
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
 
 
 @mcp.tool(
@@ -143,7 +141,7 @@ def skypilot_managed_job_queue_v1(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_cancel(
+async def skypilot_managed_job_cancel(
     name: str | None = None,
     job_ids: list[int] | None = None,
     cancel_all: bool = False,
@@ -153,12 +151,9 @@ def skypilot_managed_job_cancel(
     graceful_timeout: int | None = None,
 ) -> str:
     """Cancel managed jobs."""
-    specifiers = [name is not None, job_ids is not None, cancel_all, pool is not None]
-    if sum(specifiers) != 1:
-        raise ValueError(
-            "Specify exactly one of: name, job_ids, cancel_all=True, or pool."
-        )
-    request_id = sky.jobs.cancel(
+    _require_exactly_one(name=name, job_ids=job_ids, cancel_all=cancel_all, pool=pool)
+    request_id = await asyncio.to_thread(
+        sky.jobs.cancel,
         name=name,
         job_ids=job_ids,
         all=cancel_all,
@@ -167,12 +162,7 @@ def skypilot_managed_job_cancel(
         graceful=graceful,
         graceful_timeout=graceful_timeout,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Managed job cancel request submitted.",
-        }
-    )
+    return _submitted_response(request_id, "Managed job cancel request submitted.")
 
 
 @mcp.tool(
@@ -189,7 +179,7 @@ def skypilot_managed_job_cancel(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_managed_job_logs(
+async def skypilot_managed_job_logs(
     name: str | None = None,
     job_id: int | None = None,
     controller: bool = False,
@@ -198,7 +188,8 @@ def skypilot_managed_job_logs(
     tail: int = 100,
 ) -> str:
     """Get managed job logs."""
-    return capture_managed_job_logs(
+    return await asyncio.to_thread(
+        capture_managed_job_logs,
         name=name,
         job_id=job_id,
         controller=controller,
@@ -1,17 +1,17 @@
 """Worker pool management tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
     _parse_update_mode,
+    _require_exactly_one,
+    _submitted_response,
+    arun_and_serialize,
     capture_pool_logs,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -27,7 +27,7 @@ from skypilot_mcp.helpers import (
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_pool_apply(
+async def skypilot_pool_apply(
     pool_name: str,
     task_yaml: str | None = None,
     mode: str = "rolling",
@@ -35,19 +35,16 @@ def skypilot_pool_apply(
 ) -> str:
     """Apply a configuration to a worker pool."""
     update_mode = _parse_update_mode(mode)
-    dag = load_dag_from_yaml(task_yaml) if task_yaml else None
-    request_id = sky.jobs.pool_apply(
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml) if task_yaml else None
+    request_id = await asyncio.to_thread(
+        sky.jobs.pool_apply,
         task=dag,
         pool_name=pool_name,
         mode=update_mode,
         workers=workers,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "pool_name": pool_name,
-            "message": "Pool apply request submitted.",
-        }
+    return _submitted_response(
+        request_id, "Pool apply request submitted.", pool_name=pool_name
     )
 
 
@@ -62,13 +59,11 @@ def skypilot_pool_apply(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_pool_status(
+async def skypilot_pool_status(
     pool_names: list[str] | None = None,
 ) -> str:
     """Get pool statuses."""
-    request_id = sky.jobs.pool_status(pool_names=pool_names)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.jobs.pool_status, pool_names=pool_names)
 
 
 @mcp.tool(
@@ -81,27 +76,20 @@ def skypilot_pool_status(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_pool_down(
+async def skypilot_pool_down(
     pool_names: list[str] | None = None,
     delete_all: bool = False,
     purge: bool = False,
 ) -> str:
     """Delete worker pool(s)."""
-    if not pool_names and not delete_all:
-        raise ValueError("Specify pool_names or set delete_all=True.")
-    if pool_names and delete_all:
-        raise ValueError("Specify pool_names or delete_all=True, not both.")
-    request_id = sky.jobs.pool_down(
+    _require_exactly_one(pool_names=pool_names, delete_all=delete_all)
+    request_id = await asyncio.to_thread(
+        sky.jobs.pool_down,
         pool_names=pool_names,
         all=delete_all,
         purge=purge,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Pool down request submitted.",
-        }
-    )
+    return _submitted_response(request_id, "Pool down request submitted.")
 
 
 @mcp.tool(
@@ -116,14 +104,15 @@ def skypilot_pool_down(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_pool_logs(
+async def skypilot_pool_logs(
     pool_name: str,
     target: str = "controller",
     worker_id: int | None = None,
     tail: int = 100,
 ) -> str:
     """Get pool logs."""
-    return capture_pool_logs(
+    return await asyncio.to_thread(
+        capture_pool_logs,
         pool_name=pool_name,
         target=target,
         worker_id=worker_id,
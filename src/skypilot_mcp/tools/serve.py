@@ -1,17 +1,17 @@
 """Sky Serve (service) management tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
     _parse_update_mode,
+    _require_exactly_one,
+    _submitted_response,
+    arun_and_serialize,
     capture_serve_logs,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -26,19 +26,17 @@ from skypilot_mcp.helpers import (
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_up(
+async def skypilot_serve_up(
     task_yaml: str,
     service_name: str,
 ) -> str:
     """Launch a service."""
-    dag = load_dag_from_yaml(task_yaml)
-    request_id = sky.serve.up(dag, service_name=service_name)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "service_name": service_name,
-            "message": "Service launch submitted. Use skypilot_get_request to check status.",
-        }
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    request_id = await asyncio.to_thread(sky.serve.up, dag, service_name=service_name)
+    return _submitted_response(
+        request_id,
+        "Service launch submitted. Use skypilot_get_request to check status.",
+        service_name=service_name,
     )
 
 
@@ -53,21 +51,19 @@ def skypilot_serve_up(
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_update(
+async def skypilot_serve_update(
     task_yaml: str,
     service_name: str,
     mode: str = "rolling",
 ) -> str:
     """Update a service."""
     update_mode = _parse_update_mode(mode)
-    dag = load_dag_from_yaml(task_yaml)
-    request_id = sky.serve.update(dag, service_name=service_name, mode=update_mode)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "service_name": service_name,
-            "message": "Service update submitted.",
-        }
+    dag = await asyncio.to_thread(load_dag_from_yaml, task_yaml)
+    request_id = await asyncio.to_thread(
+        sky.serve.update, dag, service_name=service_name, mode=update_mode
+    )
+    return _submitted_response(
+        request_id, "Service update submitted.", service_name=service_name
     )
 
 
@@ -81,27 +77,20 @@ def skypilot_serve_update(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_down(
+async def skypilot_serve_down(
     service_names: list[str] | None = None,
     delete_all: bool = False,
     purge: bool = False,
 ) -> str:
     """Tear down service(s)."""
-    if not service_names and not delete_all:
-        raise ValueError("Specify service_names or set delete_all=True.")
-    if service_names and delete_all:
-        raise ValueError("Specify service_names or delete_all=True, not both.")
-    request_id = sky.serve.down(
+    _require_exactly_one(service_names=service_names, delete_all=delete_all)
+    request_id = await asyncio.to_thread(
+        sky.serve.down,
         service_names=service_names,
         all=delete_all,
         purge=purge,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "message": "Service down request submitted.",
-        }
-    )
+    return _submitted_response(request_id, "Service down request submitted.")
 
 
 @mcp.tool(
@@ -115,13 +104,11 @@ def skypilot_serve_down(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_status(
+async def skypilot_serve_status(
     service_names: list[str] | None = None,
 ) -> str:
     """Get service statuses."""
-    request_id = sky.serve.status(service_names=service_names)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.serve.status, service_names=service_names)
 
 
 @mcp.tool(
@@ -136,14 +123,15 @@ def skypilot_serve_status(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_logs(
+async def skypilot_serve_logs(
     service_name: str,
     target: str = "controller",
     replica_id: int | None = None,
     tail: int = 100,
 ) -> str:
     """Get service logs."""
-    return capture_serve_logs(
+    return await asyncio.to_thread(
+        capture_serve_logs,
         service_name=service_name,
         target=target,
         replica_id=replica_id,
@@ -162,22 +150,21 @@ def skypilot_serve_logs(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_serve_terminate_replica(
+async def skypilot_serve_terminate_replica(
     service_name: str,
     replica_id: int,
     purge: bool = False,
 ) -> str:
     """Terminate a service replica."""
-    request_id = sky.serve.terminate_replica(
+    request_id = await asyncio.to_thread(
+        sky.serve.terminate_replica,
         service_name=service_name,
         replica_id=replica_id,
         purge=purge,
     )
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "service_name": service_name,
-            "replica_id": replica_id,
-            "message": "Replica termination submitted.",
-        }
+    return _submitted_response(
+        request_id,
+        "Replica termination submitted.",
+        service_name=service_name,
+        replica_id=replica_id,
     )
@@ -1,14 +1,13 @@
 """Storage management tools."""
 
-import json
-
-import sky
+import asyncio
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _submitted_response,
+    arun_and_serialize,
     handle_skypilot_error,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
@@ -19,11 +18,9 @@ from skypilot_mcp.helpers import (
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_storage_ls() -> str:
+async def skypilot_storage_ls() -> str:
     """List storage objects."""
-    request_id = sky.storage_ls()
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.storage_ls)
 
 
 @mcp.tool(
@@ -35,13 +32,9 @@ def skypilot_storage_ls() -> str:
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_storage_delete(name: str) -> str:
+async def skypilot_storage_delete(name: str) -> str:
     """Delete a storage object."""
-    request_id = sky.storage_delete(name)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "name": name,
-            "message": "Storage delete request submitted.",
-        }
+    request_id = await asyncio.to_thread(sky.storage_delete, name)
+    return _submitted_response(
+        request_id, "Storage delete request submitted.", name=name
     )
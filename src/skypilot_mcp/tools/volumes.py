@@ -1,30 +1,42 @@
 """Volume management tools."""
 
-import json
-
-import sky
+import asyncio
+from typing import Any
 
 from skypilot_mcp.app import mcp
 from skypilot_mcp.helpers import (
+    _dumps,
+    _submitted_response,
+    arun_and_serialize,
     handle_skypilot_error,
-    resolve_request,
-    safe_json_serialize,
+    sky,
 )
 
 
+def _build_volume_config(name: str, volume_type: str, **optional: Any) -> dict:
+    """Build a volume YAML config, omitting optional fields that are None."""
+    return {
+        "name": name,
+        "type": volume_type,
+        **{k: v for k, v in optional.items() if v is not None},
+    }
+
+
 @mcp.tool(
     name="skypilot_volume_apply",
     description=(
         "Create or register a volume. Accepts a volume configuration as a "
         "JSON/dict with fields: name, type ('k8s-pvc' or 'runpod-network-volume'), "
         "size (e.g. '100GB'), and optional fields like infra, labels, "
-        "use_existing, config. Returns a request_id."
+        "use_existing, config. The server validates the volume before "
+        "accepting the request, so there is no need to call "
+        "skypilot_volume_validate first. Returns a request_id."
     ),
     tags={"volume"},
     annotations={"destructiveHint": False, "openWorldHint": True},
 )
 @handle_skypilot_error
-def skypilot_volume_apply(
+async def skypilot_volume_apply(
     name: str,
     volume_type: str,
     size: str | None = None,
@@ -36,30 +48,18 @@ def skypilot_volume_apply(
     """Create or register a volume."""
     from sky.volumes.volume import Volume
 
-    vol_config: dict = {
-        "name": name,
-        "type": volume_type,
-    }
-    if size is not None:
-        vol_config["size"] = size
-    if infra is not None:
-        vol_config["infra"] = infra
-    if labels is not None:
-        vol_config["labels"] = labels
-    if use_existing is not None:
-        vol_config["use_existing"] = use_existing
-    if config is not None:
-        vol_config["config"] = config
-
-    volume = Volume.from_yaml_config(vol_config)
-    request_id = sky.volumes.apply(volume)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "name": name,
-            "message": "Volume apply request submitted.",
-        }
+    vol_config = _build_volume_config(
+        name,
+        volume_type,
+        size=size,
+        infra=infra,
+        labels=labels,
+        use_existing=use_existing,
+        config=config,
     )
+    volume = Volume.from_yaml_config(vol_config)
+    request_id = await asyncio.to_thread(sky.volumes.apply, volume)
+    return _submitted_response(request_id, "Volume apply request submitted.", name=name)
 
 
 @mcp.tool(
@@ -72,13 +72,11 @@ def skypilot_volume_apply(
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_volume_ls(
+async def skypilot_volume_ls(
     refresh: bool = False,
 ) -> str:
     """List volumes."""
-    request_id = sky.volumes.ls(refresh=refresh)
-    result = resolve_request(request_id)
-    return safe_json_serialize(result)
+    return await arun_and_serialize(sky.volumes.ls, refresh=refresh)
 
 
 @mcp.tool(
@@ -92,18 +90,14 @@ def skypilot_volume_ls(
     annotations={"destructiveHint": True},
 )
 @handle_skypilot_error
-def skypilot_volume_delete(
+async def skypilot_volume_delete(
     names: list[str],
     purge: bool = False,
 ) -> str:
     """Delete volumes."""
-    request_id = sky.volumes.delete(names=names, purge=purge)
-    return json.dumps(
-        {
-            "request_id": str(request_id),
-            "names": names,
-            "message": "Volume delete request submitted.",
-        }
+    request_id = await asyncio.to_thread(sky.volumes.delete, names=names, purge=purge)
+    return _submitted_response(
+        request_id, "Volume delete request submitted.", names=names
     )
 
 
@@ -112,13 +106,15 @@ def skypilot_volume_delete(
     description=(
         "Validate a volume configuration without creating it. "
         "Checks that the volume specification is valid on the server side. "
-        "Raises an error if validation fails, returns success otherwise."
+        "Raises an error if validation fails, returns success otherwise. "
+        "skypilot_volume_apply runs the same checks, so use this only to "
+        "check a configuration without creating the volume."
     ),
     tags={"volume"},
     annotations={"readOnlyHint": True},
 )
 @handle_skypilot_error
-def skypilot_volume_validate(
+async def skypilot_volume_validate(
     name: str,
     volume_type: str,
     size: str | None = None,
@@ -130,24 +126,18 @@ def skypilot_volume_validate(
     """Validate a volume configuration."""
     from sky.volumes.volume import Volume
 
-    vol_config: dict = {
-        "name": name,
-        "type": volume_type,
-    }
-    if size is not None:
-        vol_config["size"] = size
-    if infra is not None:
-        vol_config["infra"] = infra
-    if labels is not None:
-        vol_config["labels"] = labels
-    if use_existing is not None:
-        vol_config["use_existing"] = use_existing
-    if config is not None:
-        vol_config["config"] = config
-
+    vol_config = _build_volume_config(
+        name,
+        volume_type,
+        size=size,
+        infra=infra,
+        labels=labels,
+        use_existing=use_existing,
+        config=config,
+    )
     volume = Volume.from_yaml_config(vol_config)
-    sky.volumes.validate(volume)
-    return json.dumps(
+    await asyncio.to_thread(sky.volumes.validate, volume)
+    return _dumps(
         {
             "status": "valid",
             "name": name,
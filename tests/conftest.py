@@ -9,27 +9,104 @@ import sky.exceptions as _sky_exc
 _MISSING_EXCEPTIONS = [
     "VolumeNotReadyError",
 ]
-for _name in _MISSING_EXCEPTIONS:
-    if not hasattr(_sky_exc, _name):
-        _cls = type(_name, (Exception,), {})
-        setattr(_sky_exc, _name, _cls)
+_existing = vars(_sky_exc)
+_sky_exc.__dict__.update(
+    {n: type(n, (Exception,), {}) for n in _MISSING_EXCEPTIONS if n not in _existing}
+)
 # ---- End early patching ----
 
+import importlib  # noqa: E402
+import importlib.abc  # noqa: E402
+import sys  # noqa: E402
+import types  # noqa: E402
+from unittest.mock import MagicMock  # noqa: E402
+
 import pytest  # noqa: E402
+import sky  # noqa: E402
 
+# Tool modules that parse task YAML through load_dag_from_yaml.
+_DAG_LOADER_MODULES = (
+    "skypilot_mcp.tools.cluster",
+    "skypilot_mcp.tools.dag",
+    "skypilot_mcp.tools.managed_jobs",
+    "skypilot_mcp.tools.pools",
+    "skypilot_mcp.tools.serve",
+)
 
-@pytest.fixture
-def mock_sky(monkeypatch):
-    """Replace ``sky`` with a MagicMock in every tool / helper module.
+# Modules under this prefix that bind ``sky`` at import time see the mock.
+_SKY_PATCH_PREFIX = "skypilot_mcp."
 
-    Only the SDK calls are mocked; real SkyPilot enums and exceptions are
-    still used so that tests catch incompatibilities with the installed SDK.
+
+class _PatchSkyOnImport(importlib.abc.MetaPathFinder):
+    """Patch ``sky`` in ``skypilot_mcp`` modules first imported mid-test.
+
+    Modules already in ``sys.modules`` are patched directly by ``mock_sky``;
+    this covers the rest without importing every tool module up front.
+    """
+
+    def __init__(self, mock, monkeypatch):
+        self._mock = mock
+        self._monkeypatch = monkeypatch
+
+    def find_spec(self, fullname, path, target=None):
+        if not fullname.startswith(_SKY_PATCH_PREFIX):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_patch(module):
+            exec_module(module)
+            if hasattr(module, "sky"):
+                self._monkeypatch.setattr(module, "sky", self._mock)
+
+        spec.loader.exec_module = exec_and_patch
+        return spec
+
+
+def _sdk_spec(module):
+    """Attribute names of an SDK (sub)module and of its ``client.sdk``.
+
+    Not every SkyPilot release re-exports all client SDK functions from the
+    package, so the client module's names are allowed as well.
+    """
+    try:
+        client = importlib.import_module(f"{module.__name__}.client.sdk")
+    except ImportError:
+        return dir(module)
+    return sorted({*dir(module), *dir(client)})
+
+
+class _SkyMock(MagicMock):
+    """MagicMock whose SDK functions return ``req-<name>-001`` by default.
+
+    Children are created on first access and the request id is produced on
+    first call, so it survives ``reset_mock(return_value=True)``. The root and
+    its SDK submodules are spec'd, so a misspelled SDK call raises
+    AttributeError instead of silently returning a mock.
     """
-    from unittest.mock import MagicMock
 
-    mock = MagicMock()
+    def _get_child_mock(self, **kw):
+        if kw.get("_new_name") == "()":
+            return f"req-{self._mock_name}-001"
+        # Spec SDK submodules (sky.jobs, sky.serve, ...) like the root.
+        name = kw.get("name") or ""
+        real = getattr(sky, name, None)
+        if self._mock_parent is None and isinstance(real, types.ModuleType):
+            kw["spec_set"] = _sdk_spec(real)
+        return super()._get_child_mock(**kw)
 
-    # --- Sensible defaults so tools don't crash on basic calls -----------
+
+def _set_defaults(mock):
+    """Configure the SDK calls whose result is not a request id."""
     mock.api_info.return_value = {
         "status": "healthy",
         "api_version": "1",
@@ -37,121 +114,76 @@ def mock_sky(monkeypatch):
         "commit": "abc1234",
     }
     mock.api_status.return_value = []
-
-    # Request-id pattern for async operations
-    mock.status.return_value = "req-status-001"
-    mock.launch.return_value = "req-launch-001"
-    mock.exec.return_value = "req-exec-001"
-    mock.stop.return_value = "req-stop-001"
-    mock.start.return_value = "req-start-001"
-    mock.down.return_value = "req-down-001"
-    mock.autostop.return_value = "req-autostop-001"
-    mock.queue.return_value = "req-queue-001"
-    mock.job_status.return_value = "req-jobstatus-001"
-    mock.cancel.return_value = "req-cancel-001"
-    mock.cost_report.return_value = "req-cost-001"
-    mock.storage_ls.return_value = "req-storage-ls-001"
-    mock.storage_delete.return_value = "req-storage-del-001"
-    mock.api_cancel.return_value = "req-api-cancel-001"
-    mock.endpoints.return_value = "req-endpoints-001"
-    mock.optimize.return_value = "req-optimize-001"
+    mock.get.return_value = []
     mock.validate.return_value = None
     mock.download_logs.return_value = {"1": "/tmp/logs/job-1"}
     mock.tail_provision_logs.return_value = 0
     mock.tail_autostop_logs.return_value = 0
+    mock.stream_and_get.return_value = None
+    mock.dashboard.return_value = None
+    mock.Task.from_yaml_str.return_value = MagicMock()
 
-    # Blocking resolve default
-    mock.get.return_value = []
-
-    # API server lifecycle
-    for attr in (
-        "api_start",
-        "api_stop",
-        "api_server_logs",
-        "api_login",
-        "api_logout",
-        "stream_and_get",
-        "reload_config",
-        "dashboard",
-    ):
-        getattr(mock, attr).return_value = None
-    mock.workspaces.return_value = "req-workspaces-001"
-
-    # Infra
-    for attr in (
-        "check",
-        "enabled_clouds",
-        "list_accelerators",
-        "list_accelerator_counts",
-        "kubernetes_node_info",
-        "realtime_kubernetes_gpu_availability",
-        "kubernetes_label_gpus",
-        "status_kubernetes",
-        "local_up",
-        "local_down",
-        "ssh_up",
-        "ssh_down",
-        "realtime_slurm_gpu_availability",
-        "slurm_node_info",
-    ):
-        getattr(mock, attr).return_value = f"req-{attr}-001"
-
-    # Managed jobs
-    mock.jobs = MagicMock()
-    mock.jobs.launch.return_value = "req-mjob-launch-001"
-    mock.jobs.queue.return_value = "req-mjob-queue-001"
-    mock.jobs.queue_v2.return_value = "req-mjob-queue-v2-001"
-    mock.jobs.cancel.return_value = "req-mjob-cancel-001"
     mock.jobs.tail_logs.return_value = 0
     mock.jobs.download_logs.return_value = {1: "/tmp/logs/mjob-1"}
     mock.jobs.dashboard.return_value = None
-    mock.jobs.pool_apply.return_value = "req-pool-apply-001"
-    mock.jobs.pool_status.return_value = "req-pool-status-001"
-    mock.jobs.pool_down.return_value = "req-pool-down-001"
     mock.jobs.pool_tail_logs.return_value = None
     mock.jobs.pool_sync_down_logs.return_value = None
-
-    # Serve
-    mock.serve = MagicMock()
-    mock.serve.up.return_value = "req-serve-up-001"
-    mock.serve.update.return_value = "req-serve-update-001"
-    mock.serve.down.return_value = "req-serve-down-001"
-    mock.serve.status.return_value = "req-serve-status-001"
     mock.serve.tail_logs.return_value = None
-    mock.serve.terminate_replica.return_value = "req-serve-terminate-001"
     mock.serve.sync_down_logs.return_value = None
-
-    # Volumes
-    mock.volumes = MagicMock()
-    mock.volumes.apply.return_value = "req-vol-apply-001"
-    mock.volumes.ls.return_value = "req-vol-ls-001"
-    mock.volumes.delete.return_value = "req-vol-delete-001"
     mock.volumes.validate.return_value = None
 
-    # Task creation
-    mock.Task.from_yaml_str.return_value = MagicMock()
 
-    # Patch sky in all tool modules and helper/app modules
-    for module_path in [
-        "skypilot_mcp.tools.api_server",
-        "skypilot_mcp.tools.cluster",
-        "skypilot_mcp.tools.config",
-        "skypilot_mcp.tools.cost",
-        "skypilot_mcp.tools.dag",
-        "skypilot_mcp.tools.infra",
-        "skypilot_mcp.tools.jobs",
-        "skypilot_mcp.tools.logs",
-        "skypilot_mcp.tools.managed_jobs",
-        "skypilot_mcp.tools.pools",
-        "skypilot_mcp.tools.serve",
-        "skypilot_mcp.tools.storage",
-        "skypilot_mcp.tools.volumes",
-        "skypilot_mcp.helpers",
-        "skypilot_mcp.app",
-    ]:
-        monkeypatch.setattr(f"{module_path}.sky", mock)
-
-    # Patch the directly-imported sky_dashboard in config module
-    monkeypatch.setattr("skypilot_mcp.tools.config.sky_dashboard", mock.dashboard)
+@pytest.fixture(scope="session")
+def _sky_mock_template():
+    """The ``sky`` mock tree, built once and reset by ``mock_sky``."""
+    return _SkyMock(spec_set=_sdk_spec(sky))
+
+
+@pytest.fixture
+def mock_sky(_sky_mock_template, monkeypatch, tmp_path):
+    """Replace ``sky`` with a MagicMock in every tool / helper module.
+
+    Only the SDK calls are mocked; real SkyPilot enums and exceptions are
+    still used so that tests catch incompatibilities with the installed SDK.
+    """
+    mock = _sky_mock_template
+    # Tests override return values too, so those are reset along with the
+    # call history and side effects rather than carried into the next test.
+    mock.reset_mock(return_value=True, side_effect=True)
+    _set_defaults(mock)
+
+    for name, module in list(sys.modules.items()):
+        if name.startswith(_SKY_PATCH_PREFIX) and hasattr(module, "sky"):
+            monkeypatch.setattr(module, "sky", mock)
+    monkeypatch.setattr(
+        sys, "meta_path", [_PatchSkyOnImport(mock, monkeypatch), *sys.meta_path]
+    )
+
+    # Parsed-YAML caches may hold objects built by another test's mock.
+    from skypilot_mcp import helpers
+
+    helpers._parse_task_yaml.cache_clear()
+    helpers._parse_dag_yaml.cache_clear()
+
+    # Likewise for catalog responses cached by the infra tools, if loaded.
+    if infra := sys.modules.get("skypilot_mcp.tools.infra"):
+        infra.invalidate_catalog_cache()
+
+    # app.py imports sky lazily inside its lifespan, so patch the probe on
+    # the real module instead, and keep its on-disk probe cache per-test.
+    monkeypatch.setattr("sky.api_info", mock.api_info)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    # skypilot_dashboard imports the SDK's dashboard function when called.
+    monkeypatch.setattr("sky.client.sdk.dashboard", mock.dashboard)
 
     return mock
+
+
+@pytest.fixture
+def mock_dag(monkeypatch):
+    """Skip task YAML parsing in the tools; returns the DAG they receive."""
+    dag = object()
+    for module_path in _DAG_LOADER_MODULES:
+        monkeypatch.setattr(f"{module_path}.load_dag_from_yaml", lambda *a, **kw: dag)
+    return dag
@@ -0,0 +1,72 @@
+"""Tests for API server tools — request status serialization."""
+
+import json
+
+from sky.server.requests.payloads import RequestPayload
+
+from skypilot_mcp.helpers import safe_json_serialize
+from skypilot_mcp.tools.api_server import (
+    skypilot_api_login,
+    skypilot_api_logout,
+    skypilot_api_start,
+    skypilot_api_status,
+    skypilot_api_stop,
+)
+
+
+def _payload(request_id: str, status: str) -> RequestPayload:
+    return RequestPayload(
+        request_id=request_id,
+        name="sky.launch",
+        entrypoint="",
+        request_body="{}",
+        status=status,
+        created_at=1700000000.25,
+        user_id="u1",
+        return_value="null",
+        error="",
+        pid=None,
+        schedule_type="long",
+        user_name="alice",
+        cluster_name="c1",
+        status_msg=None,
+        should_retry=False,
+        finished_at=None,
+    )
+
+
+async def test_api_status_payloads_match_generic_serialization(mock_sky):
+    rows = [_payload("req-1", "RUNNING"), _payload("req-2", "SUCCEEDED")]
+    mock_sky.api_status.return_value = rows
+    result = await skypilot_api_status()
+    assert json.loads(result) == json.loads(safe_json_serialize(rows))
+    assert result == safe_json_serialize(rows)
+
+
+async def test_api_status_other_results_use_generic_path(mock_sky):
+    mock_sky.api_status.return_value = [{"request_id": "req-1"}]
+    assert json.loads(await skypilot_api_status()) == [{"request_id": "req-1"}]
+
+
+async def test_api_lifecycle_tools_return_static_messages(mock_sky):
+    assert json.loads(await skypilot_api_start()) == {"message": "API server started."}
+    assert json.loads(await skypilot_api_stop()) == {"message": "API server stopped."}
+    assert json.loads(await skypilot_api_login()) == {
+        "message": "Logged in to API server."
+    }
+    assert json.loads(await skypilot_api_logout()) == {
+        "message": "Logged out of API server."
+    }
+    mock_sky.api_start.assert_called_once()
+    mock_sky.api_logout.assert_called_once()
+
+
+async def test_api_login_and_logout_clear_catalog_cache(mock_sky):
+    from skypilot_mcp.tools import infra
+
+    await infra.skypilot_enabled_clouds()
+    await skypilot_api_login(endpoint="http://other")
+    await infra.skypilot_enabled_clouds()
+    await skypilot_api_logout()
+    await infra.skypilot_enabled_clouds()
+    assert mock_sky.enabled_clouds.call_count == 3
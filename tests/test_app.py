@@ -0,0 +1,70 @@
+"""Tests for the app lifespan — startup probe and its on-disk cache."""
+
+from skypilot_mcp.app import _api_info_cache_path, mcp, skypilot_lifespan
+
+
+async def test_lifespan_probe_is_cached(mock_sky):
+    async with skypilot_lifespan(mcp) as ctx:
+        await ctx["api_probe"]
+    async with skypilot_lifespan(mcp) as ctx:
+        await ctx["api_probe"]
+    mock_sky.api_info.assert_called_once()
+    assert _api_info_cache_path().exists()
+
+
+async def test_lifespan_ignores_stale_cache(mock_sky):
+    import os
+
+    async with skypilot_lifespan(mcp) as ctx:
+        await ctx["api_probe"]
+    os.utime(_api_info_cache_path(), (0, 0))
+    async with skypilot_lifespan(mcp) as ctx:
+        await ctx["api_probe"]
+    assert mock_sky.api_info.call_count == 2
+
+
+async def test_lifespan_does_not_wait_for_probe(mock_sky):
+    import threading
+
+    release = threading.Event()
+    mock_sky.api_info.side_effect = lambda: release.wait(5)
+    try:
+        async with skypilot_lifespan(mcp) as ctx:
+            assert not ctx["api_probe"].done()
+    finally:
+        release.set()
+
+
+async def test_lifespan_tolerates_unreachable_server(mock_sky):
+    mock_sky.api_info.side_effect = ConnectionError("down")
+    async with skypilot_lifespan(mcp) as ctx:
+        await ctx["api_probe"]
+    assert not _api_info_cache_path().exists()
+
+
+def test_importing_server_does_not_import_sky():
+    import subprocess
+    import sys
+
+    code = "import sys, skypilot_mcp.server; print('sky' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_http_transport_enables_gzip(monkeypatch):
+    import sys
+    from unittest.mock import MagicMock
+
+    from starlette.middleware.gzip import GZipMiddleware
+
+    from skypilot_mcp import server
+
+    run = MagicMock()
+    monkeypatch.setattr(server.mcp, "run", run)
+    monkeypatch.setattr(sys, "argv", ["skypilot-mcp", "--transport", "http"])
+    server.main()
+    (middleware,) = run.call_args.kwargs["middleware"]
+    assert middleware.cls is GZipMiddleware
+    assert middleware.kwargs["minimum_size"] == server.HTTP_GZIP_MIN_BYTES
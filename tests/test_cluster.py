@@ -1,73 +1,80 @@
 """Tests for cluster tools — validation and enum conversion logic only."""
 
-from unittest.mock import MagicMock, patch
+import json
 
 import pytest
 from fastmcp.exceptions import ToolError
 from sky.skylet.autostop_lib import AutostopWaitFor
 from sky.utils.common import OptimizeTarget, StatusRefreshMode
 
+from skypilot_mcp.tools.cluster import (
+    skypilot_cluster_autostop,
+    skypilot_cluster_launch,
+    skypilot_cluster_start,
+    skypilot_cluster_status,
+    skypilot_overview,
+)
 
-def test_launch_resolves_optimize_target(mock_sky):
-    """optimize_target string should be converted to the real enum."""
-    from skypilot_mcp.tools.cluster import skypilot_cluster_launch
 
-    mock_dag = MagicMock()
-    with patch("skypilot_mcp.tools.cluster.load_dag_from_yaml", return_value=mock_dag):
-        skypilot_cluster_launch(task_yaml="run: echo hi", optimize_target="TIME")
+async def test_launch_resolves_optimize_target(mock_sky, mock_dag):
+    """optimize_target string should be converted to the real enum."""
+    await skypilot_cluster_launch(task_yaml="run: echo hi", optimize_target="TIME")
 
     call_kwargs = mock_sky.launch.call_args[1]
     assert call_kwargs["optimize_target"] == OptimizeTarget.TIME
 
 
-def test_launch_resolves_wait_for(mock_sky):
+async def test_launch_resolves_wait_for(mock_sky, mock_dag):
     """wait_for string should be converted to the real AutostopWaitFor enum."""
-    from skypilot_mcp.tools.cluster import skypilot_cluster_launch
-
-    mock_dag = MagicMock()
-    with patch("skypilot_mcp.tools.cluster.load_dag_from_yaml", return_value=mock_dag):
-        skypilot_cluster_launch(
-            task_yaml="run: echo hi",
-            cluster_name="c",
-            wait_for="jobs",
-        )
+    await skypilot_cluster_launch(
+        task_yaml="run: echo hi",
+        cluster_name="c",
+        wait_for="jobs",
+    )
 
     assert mock_sky.launch.call_args[1]["wait_for"] == AutostopWaitFor.JOBS
 
 
-def test_start_resolves_wait_for(mock_sky):
+async def test_start_resolves_wait_for(mock_sky):
     """wait_for on start should also use the real enum."""
-    from skypilot_mcp.tools.cluster import skypilot_cluster_start
-
-    skypilot_cluster_start("c", wait_for="jobs_and_ssh")
+    await skypilot_cluster_start("c", wait_for="jobs_and_ssh")
     assert mock_sky.start.call_args[1]["wait_for"] == AutostopWaitFor.JOBS_AND_SSH
 
 
-def test_autostop_resolves_wait_for(mock_sky):
-    from skypilot_mcp.tools.cluster import skypilot_cluster_autostop
-
-    skypilot_cluster_autostop("c", idle_minutes=10, wait_for="none")
+async def test_autostop_resolves_wait_for(mock_sky):
+    await skypilot_cluster_autostop("c", idle_minutes=10, wait_for="none")
     assert mock_sky.autostop.call_args[1]["wait_for"] == AutostopWaitFor.NONE
 
 
-def test_status_resolves_refresh_mode(mock_sky):
+async def test_status_resolves_refresh_mode(mock_sky):
     """refresh string should be converted to the real StatusRefreshMode enum."""
-    from skypilot_mcp.tools.cluster import skypilot_cluster_status
-
     mock_sky.get.return_value = []
-    skypilot_cluster_status(refresh="FORCE")
+    await skypilot_cluster_status(refresh="FORCE")
     assert mock_sky.status.call_args[1]["refresh"] == StatusRefreshMode.FORCE
 
 
-def test_status_invalid_refresh_raises(mock_sky):
-    from skypilot_mcp.tools.cluster import skypilot_cluster_status
-
+async def test_status_invalid_refresh_raises(mock_sky):
     with pytest.raises(ToolError, match="Invalid"):
-        skypilot_cluster_status(refresh="INVALID")
-
+        await skypilot_cluster_status(refresh="INVALID")
 
-def test_launch_empty_yaml_raises(mock_sky):
-    from skypilot_mcp.tools.cluster import skypilot_cluster_launch
 
+async def test_launch_empty_yaml_raises(mock_sky):
     with pytest.raises(ToolError, match="Invalid input"):
-        skypilot_cluster_launch(task_yaml="")
+        await skypilot_cluster_launch(task_yaml="")
+
+
+async def test_overview_resolves_status_and_cost_together(mock_sky):
+    mock_sky.status.return_value = "req-status"
+    mock_sky.cost_report.return_value = "req-cost"
+    mock_sky.get.side_effect = {"req-status": [], "req-cost": [{"cost": 1.5}]}.get
+    result = json.loads(await skypilot_overview(days=7))
+    assert result == {"clusters": [], "cost_report": [{"cost": 1.5}]}
+    mock_sky.cost_report.assert_called_once_with(days=7)
+    mock_sky.api_status.assert_called_once_with(request_ids=["req-status", "req-cost"])
+
+
+async def test_status_without_wait_returns_request_id(mock_sky):
+    result = json.loads(await skypilot_cluster_status(wait=False))
+    assert result["request_id"] == "req-status-001"
+    mock_sky.get.assert_not_called()
+    mock_sky.api_status.assert_not_called()
@@ -12,24 +12,39 @@ import pathlib
 from datetime import datetime
 
 import pytest
+import sky.exceptions as sky_exc
 from fastmcp.exceptions import ToolError
 from pydantic import BaseModel
 from sky.serve.serve_utils import UpdateMode
 from sky.utils.common import OptimizeTarget, StatusRefreshMode
 
 from skypilot_mcp.helpers import (
+    _BoundedListStream,
+    _dumps,
+    _env_positive_int,
+    _LazyModule,
     _make_serializable,
     _parse_optimize_target,
     _parse_status_refresh_mode,
     _parse_update_mode,
+    _parse_wait_for,
+    _require_exactly_one,
+    _submitted_response,
+    _tail_bytes,
+    _tail_file,
+    aresolve_request,
+    aresolve_requests,
+    arun_and_serialize,
+    capture_api_server_logs,
     capture_managed_job_logs,
+    capture_stdio,
     create_task_from_yaml,
     handle_skypilot_error,
     load_dag_from_yaml,
-    resolve_request,
     safe_json_serialize,
+    safe_json_serialize_records,
 )
-
+from skypilot_mcp.tools.logs import skypilot_tail_provision_logs
 
 # ---------------------------------------------------------------------------
 # safe_json_serialize / _make_serializable
@@ -44,6 +59,58 @@ def test_serialize_dict():
 def test_serialize_non_json_type_uses_str():
     parsed = json.loads(safe_json_serialize({"time": datetime(2024, 1, 1)}))
     assert "2024" in parsed["time"]
+    assert parsed["time"] == str(datetime(2024, 1, 1))
+
+
+def test_serialize_plain_data_skips_conversion(monkeypatch):
+    def fail(obj):
+        raise AssertionError("conversion walk should not run")
+
+    monkeypatch.setattr("skypilot_mcp.helpers._make_serializable", fail)
+    obj = {"message": "ok", "items": [1, 2.5, None, True]}
+    assert json.loads(safe_json_serialize(obj)) == obj
+
+
+def test_serialize_non_str_keys_use_conversion():
+    assert json.loads(safe_json_serialize({1: "a", None: "b"})) == {
+        "1": "a",
+        "None": "b",
+    }
+
+
+def test_dumps_round_trips_tool_responses():
+    response = {"request_id": "req-1", "message": "Cluster 'ü' stopped.", "n": 2}
+    assert json.loads(_dumps(response)) == response
+
+
+def test_submitted_response_orders_keys():
+    response = _submitted_response("req-1", "Stop request submitted.", cluster_name="c")
+    assert list(json.loads(response).items()) == [
+        ("request_id", "req-1"),
+        ("cluster_name", "c"),
+        ("message", "Stop request submitted."),
+    ]
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        [],
+        [{"name": "c1", "cost": 1.5}, {"name": "c2", "cost": None}],
+        [StatusRefreshMode.FORCE, {"nested": [1, {"deep": True}]}, 2**70],
+        {"A100": [{"cloud": "aws", "price": 3.06}], "T4": []},
+        {"A100": [datetime(2024, 1, 1)], "V100": {2: "non-str key"}},
+        {1: "non-str top-level key"},
+        {
+            "jobs": [{"job_id": 1, "submitted_at": 1.7e9}, {"job_id": 2}],
+            "total_count": 2,
+        },
+        {"jobs": [], "status_counts": {}, "filtered_count": 0},
+        "not a collection",
+    ],
+)
+def test_serialize_records_matches_safe_json_serialize(result):
+    assert safe_json_serialize_records(result) == safe_json_serialize(result)
 
 
 def test_serialize_list():
@@ -54,6 +121,15 @@ def test_serialize_none():
     assert safe_json_serialize(None) == "null"
 
 
+def test_serialize_matches_stdlib_layout():
+    obj = {"name": "c1", "nodes": [1, 2], "extra": {}}
+    assert safe_json_serialize(obj) == json.dumps(obj, indent=2)
+
+
+def test_serialize_big_int_falls_back_to_stdlib():
+    assert json.loads(safe_json_serialize({"n": 2**70})) == {"n": 2**70}
+
+
 def test_serialize_pydantic_v2_model():
     class StatusResponse(BaseModel):
         name: str
@@ -61,9 +137,11 @@ def test_serialize_pydantic_v2_model():
         resources: dict
 
     obj = StatusResponse(name="c1", status="UP", resources={"gpu": "V100"})
-    parsed = json.loads(safe_json_serialize(obj))
-    assert parsed["name"] == "c1"
-    assert parsed["resources"]["gpu"] == "V100"
+    assert _make_serializable(obj) == {
+        "name": "c1",
+        "status": "UP",
+        "resources": {"gpu": "V100"},
+    }
 
 
 def test_serialize_list_of_pydantic_models():
@@ -72,9 +150,10 @@ def test_serialize_list_of_pydantic_models():
         job_name: str
 
     objs = [JobRecord(job_id=1, job_name="train"), JobRecord(job_id=2, job_name="eval")]
-    parsed = json.loads(safe_json_serialize(objs))
-    assert len(parsed) == 2
-    assert parsed[0]["job_id"] == 1
+    assert _make_serializable(objs) == [
+        {"job_id": 1, "job_name": "train"},
+        {"job_id": 2, "job_name": "eval"},
+    ]
 
 
 def test_serialize_dataclass():
@@ -83,8 +162,10 @@ def test_serialize_dataclass():
         cluster_name: str
         total_cost: float
 
-    parsed = json.loads(safe_json_serialize(CostEntry("test", 12.50)))
-    assert parsed == {"cluster_name": "test", "total_cost": 12.50}
+    assert _make_serializable(CostEntry("test", 12.50)) == {
+        "cluster_name": "test",
+        "total_cost": 12.50,
+    }
 
 
 def test_serialize_nested_pydantic():
@@ -95,8 +176,20 @@ def test_serialize_nested_pydantic():
         name: str
         inner: Inner
 
-    parsed = json.loads(safe_json_serialize(Outer(name="test", inner=Inner(value=42))))
-    assert parsed["inner"]["value"] == 42
+    obj = Outer(name="test", inner=Inner(value=42))
+    assert _make_serializable(obj) == {"name": "test", "inner": {"value": 42}}
+
+
+def test_make_serializable_dataclass_field_counts():
+    @dataclasses.dataclass
+    class Empty:
+        pass
+
+    @dataclasses.dataclass
+    class Single:
+        only: int
+
+    assert _make_serializable([Empty(), Single(1)]) == [{}, {"only": 1}]
 
 
 def test_make_serializable_enum():
@@ -106,6 +199,21 @@ def test_make_serializable_enum():
     assert _make_serializable(Status.UP) == "UP"
 
 
+def test_make_serializable_str_enum_stays_string():
+    class Mode(str, enum.Enum):
+        FAST = "fast"
+
+    assert _make_serializable({"mode": Mode.FAST}) == {"mode": Mode.FAST}
+    assert json.loads(safe_json_serialize(Mode.FAST)) == "fast"
+
+
+def test_make_serializable_container_subclasses():
+    import collections
+
+    obj = collections.OrderedDict(a=collections.deque([1]), b=(2,))
+    assert _make_serializable(obj) == {"a": "deque([1])", "b": [2]}
+
+
 def test_make_serializable_set():
     assert _make_serializable({3, 1, 2}) == [1, 2, 3]
 
@@ -138,37 +246,179 @@ def test_make_serializable_pure_posix_path():
     assert _make_serializable(pathlib.PurePosixPath("/etc/config")) == "/etc/config"
 
 
-# ---------------------------------------------------------------------------
-# resolve_request
-# ---------------------------------------------------------------------------
+def test_make_serializable_preserves_order():
+    obj = {"b": (1, {"z": 1, "a": 2}), 3: [b"x", None]}
+    result = _make_serializable(obj)
+    assert result == {"b": [1, {"z": 1, "a": 2}], "3": ["x", None]}
+    assert list(result) == ["b", "3"]
+    assert list(result["b"][1]) == ["z", "a"]
 
 
-def test_resolve_request_timeout(mock_sky):
-    import time
+def test_make_serializable_deep_nesting():
+    obj: list = []
+    for _ in range(5000):
+        obj = [obj]
+    result = _make_serializable(obj)
+    for _ in range(5000):
+        result = result[0]
+    assert result == []
 
-    def blocking_get(request_id):
-        time.sleep(5)
-        return []
 
-    mock_sky.get.side_effect = blocking_get
-    with pytest.raises(TimeoutError, match="did not complete within"):
-        resolve_request("req-slow-001", timeout=1)
+def test_make_serializable_circular_reference():
+    d: dict = {}
+    d["self"] = d
+    shared = [1]
+    assert _make_serializable([d, shared, shared]) == [
+        {"self": "[circular reference]"},
+        [1],
+        [1],
+    ]
+    assert json.loads(safe_json_serialize(d)) == {"self": "[circular reference]"}
 
 
-def test_resolve_request_propagates_errors(mock_sky):
+# ---------------------------------------------------------------------------
+# aresolve_request
+# ---------------------------------------------------------------------------
+
+
+async def test_aresolve_request_propagates_errors(mock_sky):
     mock_sky.get.side_effect = RuntimeError("connection lost")
     with pytest.raises(RuntimeError, match="connection lost"):
-        resolve_request("req-err-001")
+        await aresolve_request("req-err-001")
+
+
+async def test_aresolve_request_none_result(mock_sky):
+    mock_sky.get.return_value = None
+    assert await aresolve_request("req-none-001") is None
+
+
+async def test_aresolve_request_long_running_switches_to_long_poll(mock_sky):
+    from types import SimpleNamespace
+
+    mock_sky.api_status.return_value = [SimpleNamespace(status="RUNNING")]
+    mock_sky.get.return_value = "done"
+    result = await aresolve_request(
+        "req-poll-long", poll_min_interval=0.01, poll_max_interval=0.04
+    )
+    assert result == "done"
+    # Three polls (sleeping 10, 20 and 40ms after them), then one long-poll.
+    assert mock_sky.api_status.call_count == 3
+    mock_sky.get.assert_called_once_with("req-poll-long")
 
 
-def test_resolve_request_success(mock_sky):
+async def test_aresolve_request_long_polls_on_dedicated_pool(mock_sky):
+    import threading
+
+    mock_sky.get.side_effect = lambda request_id: threading.current_thread().name
+    assert (await aresolve_request("req-1")).startswith("sky-long-poll")
+    results = await aresolve_requests(["req-a", "req-b"])
+    assert all(name.startswith("sky-long-poll") for name in results.values())
+
+
+async def test_aresolve_request_poll_timeout(mock_sky):
+    from types import SimpleNamespace
+
+    mock_sky.api_status.return_value = [SimpleNamespace(status="PENDING")]
+    with pytest.raises(TimeoutError, match="did not complete within"):
+        await aresolve_request("req-poll-002", timeout=0.2, poll_min_interval=0.05)
+    mock_sky.get.assert_not_called()
+
+
+async def test_aresolve_request_polls_until_finished(mock_sky):
+    from types import SimpleNamespace
+
+    mock_sky.api_status.side_effect = [
+        [SimpleNamespace(status="RUNNING")],
+        [SimpleNamespace(status="FAILED")],
+    ]
+    mock_sky.get.side_effect = RuntimeError("task failed")
+    with pytest.raises(RuntimeError, match="task failed"):
+        await aresolve_request("req-poll-003", poll_min_interval=0.01)
+    assert mock_sky.api_status.call_count == 2
+
+
+async def test_aresolve_requests_shares_status_polls(mock_sky):
+    from types import SimpleNamespace
+
+    mock_sky.api_status.side_effect = [
+        [
+            SimpleNamespace(request_id="req-a", status="SUCCEEDED"),
+            SimpleNamespace(request_id="req-b", status="RUNNING"),
+        ],
+        [SimpleNamespace(request_id="req-b", status="SUCCEEDED")],
+    ]
+    mock_sky.get.side_effect = lambda request_id: f"result-{request_id}"
+    results = await aresolve_requests(["req-a", "req-b"], poll_min_interval=0.01)
+    assert results == {"req-a": "result-req-a", "req-b": "result-req-b"}
+    first, second = mock_sky.api_status.call_args_list
+    assert first.kwargs == {"request_ids": ["req-a", "req-b"]}
+    assert second.kwargs == {"request_ids": ["req-b"]}
+
+
+async def test_aresolve_requests_unknown_status_long_polls_all(mock_sky):
+    mock_sky.get.side_effect = lambda request_id: request_id.upper()
+    results = await aresolve_requests(["req-a", "req-b"])
+    assert results == {"req-a": "REQ-A", "req-b": "REQ-B"}
+    assert mock_sky.api_status.call_count == 1
+
+
+async def test_concurrent_aresolve_requests_share_status_polls(mock_sky):
+    import asyncio
+    from types import SimpleNamespace
+
+    mock_sky.api_status.side_effect = lambda request_ids: [
+        SimpleNamespace(request_id=r, status="SUCCEEDED") for r in request_ids
+    ]
+    mock_sky.get.side_effect = lambda request_id: f"result-{request_id}"
+    results = await asyncio.gather(aresolve_request("req-a"), aresolve_request("req-b"))
+    assert results == ["result-req-a", "result-req-b"]
+    mock_sky.api_status.assert_called_once()
+    assert mock_sky.api_status.call_args.kwargs["request_ids"] == ["req-a", "req-b"]
+
+
+async def test_status_poll_timeout_does_not_cancel_shared_poll(mock_sky):
+    import asyncio
+    import threading
+    from types import SimpleNamespace
+
+    release = threading.Event()
+
+    def slow_status(request_ids):
+        release.wait(5)
+        return [SimpleNamespace(request_id=r, status="SUCCEEDED") for r in request_ids]
+
+    mock_sky.api_status.side_effect = slow_status
+    mock_sky.get.side_effect = lambda request_id: request_id
+    slow = asyncio.ensure_future(aresolve_request("req-a"))
+    with pytest.raises(TimeoutError):
+        await aresolve_request("req-b", timeout=0.1)
+    release.set()
+    assert await slow == "req-a"
+
+
+async def test_arun_and_serialize_submits_resolves_and_encodes(mock_sky):
+    mock_sky.get.return_value = {"jobs": [1, 2]}
+    result = await arun_and_serialize(mock_sky.queue, "c", all_users=True)
+    assert json.loads(result) == {"jobs": [1, 2]}
+    mock_sky.queue.assert_called_once_with("c", all_users=True)
+    mock_sky.get.assert_called_once_with("req-queue-001")
+
+
+async def test_aresolve_request_success(mock_sky):
     mock_sky.get.return_value = [{"name": "cluster-1"}]
-    assert resolve_request("req-ok-001") == [{"name": "cluster-1"}]
+    assert await aresolve_request("req-ok-001") == [{"name": "cluster-1"}]
 
 
-def test_resolve_request_none_result(mock_sky):
-    mock_sky.get.return_value = None
-    assert resolve_request("req-none-001") is None
+async def test_aresolve_request_timeout(mock_sky):
+    import threading
+
+    release = threading.Event()
+    mock_sky.get.side_effect = lambda request_id: release.wait(5)
+    try:
+        with pytest.raises(TimeoutError, match="did not complete within"):
+            await aresolve_request("req-slow-001", timeout=0.1)
+    finally:
+        release.set()
 
 
 # ---------------------------------------------------------------------------
@@ -194,6 +444,30 @@ def test_handle_error_timeout():
         f()
 
 
+def test_handle_error_keeps_braces_in_message():
+    @handle_skypilot_error
+    def f():
+        raise RuntimeError("bad value {name}")
+
+    with pytest.raises(ToolError) as exc_info:
+        f()
+    assert str(exc_info.value) == "RuntimeError: bad value {name}"
+
+
+def test_handle_error_first_matching_class_wins():
+    from sky.exceptions import ClusterNotUpError
+
+    class Both(ClusterNotUpError, ValueError):
+        pass
+
+    @handle_skypilot_error
+    def f():
+        raise Both("mixed")
+
+    with pytest.raises(ToolError, match="Cluster not up: mixed"):
+        f()
+
+
 def test_handle_error_generic_exception():
     @handle_skypilot_error
     def f():
@@ -220,39 +494,57 @@ def test_handle_error_returns_on_success():
     assert f() == "ok"
 
 
+async def test_handle_error_async_function():
+    @handle_skypilot_error
+    async def f(fail):
+        if fail:
+            raise ValueError("bad input")
+        return "ok"
+
+    assert await f(False) == "ok"
+    with pytest.raises(ToolError, match="Invalid input: bad input"):
+        await f(True)
+
+
 @pytest.mark.parametrize(
     "exc_cls,exc_args,expected_match",
     [
-        ("ApiServerAuthenticationError", ("bad token",), "Authentication required"),
-        ("PermissionDeniedError", ("not allowed",), "Permission denied"),
-        ("ApiServerConnectionError", ("cannot connect",), "API server unreachable"),
-        ("ClusterDoesNotExist", ("my-cluster",), "Cluster not found"),
-        ("ResourcesUnavailableError", ("no A100s",), "Resources unavailable"),
-        ("StorageError", ("bucket issue",), "Storage error"),
-        ("NotSupportedError", ("feature X",), "Not supported"),
-        ("RequestCancelled", ("user cancelled",), "Request cancelled"),
-        ("VolumeNotFoundError", ("my-vol",), "Volume not found"),
         (
-            "ServerTemporarilyUnavailableError",
+            sky_exc.ApiServerAuthenticationError,
+            ("bad token",),
+            "Authentication required",
+        ),
+        (sky_exc.PermissionDeniedError, ("not allowed",), "Permission denied"),
+        (
+            sky_exc.ApiServerConnectionError,
+            ("cannot connect",),
+            "API server unreachable",
+        ),
+        (sky_exc.ClusterDoesNotExist, ("my-cluster",), "Cluster not found"),
+        (sky_exc.ResourcesUnavailableError, ("no A100s",), "Resources unavailable"),
+        (sky_exc.StorageError, ("bucket issue",), "Storage error"),
+        (sky_exc.NotSupportedError, ("feature X",), "Not supported"),
+        (sky_exc.RequestCancelled, ("user cancelled",), "Request cancelled"),
+        (sky_exc.VolumeNotFoundError, ("my-vol",), "Volume not found"),
+        (
+            sky_exc.ServerTemporarilyUnavailableError,
             ("overloaded",),
             "temporarily unavailable",
         ),
         (
-            "UserRequestRejectedByPolicy",
+            sky_exc.UserRequestRejectedByPolicy,
             ("denied",),
             "Request rejected by admin policy",
         ),
     ],
+    ids=lambda v: v.__name__ if isinstance(v, type) else None,
 )
 def test_handle_error_sky_exceptions(exc_cls, exc_args, expected_match):
     """Each SkyPilot exception should map to the correct ToolError message."""
-    import sky.exceptions as sky_exc
-
-    cls = getattr(sky_exc, exc_cls)
 
     @handle_skypilot_error
     def f():
-        raise cls(*exc_args)
+        raise exc_cls(*exc_args)
 
     with pytest.raises(ToolError, match=expected_match):
         f()
@@ -275,22 +567,39 @@ def test_load_dag_from_yaml_rejects_empty(mock_sky, bad_input):
         load_dag_from_yaml(bad_input)
 
 
-# ---------------------------------------------------------------------------
-# _parse_optimize_target  (uses REAL sky.utils.common.OptimizeTarget)
-# ---------------------------------------------------------------------------
+def test_load_dag_from_yaml_returns_independent_copies(mock_sky):
+    yaml_str = "name: cached-task\nrun: echo hi\n"
+    first = load_dag_from_yaml(yaml_str)
+    second = load_dag_from_yaml(yaml_str)
+    assert first is not second
+    assert first.tasks[0] is not second.tasks[0]
+    assert second.tasks[0].name == "cached-task"
+    first.tasks[0].name = "mutated"
+    assert load_dag_from_yaml(yaml_str).tasks[0].name == "cached-task"
 
 
-def test_parse_optimize_target_cost():
-    assert _parse_optimize_target("COST") == OptimizeTarget.COST
+def test_create_task_from_yaml_parses_once(mock_sky):
+    create_task_from_yaml("run: echo once")
+    create_task_from_yaml("run: echo once")
+    mock_sky.Task.from_yaml_str.assert_called_once_with("run: echo once")
 
 
-def test_parse_optimize_target_time():
-    assert _parse_optimize_target("TIME") == OptimizeTarget.TIME
+# ---------------------------------------------------------------------------
+# _parse_optimize_target  (uses REAL sky.utils.common.OptimizeTarget)
+# ---------------------------------------------------------------------------
 
 
-def test_parse_optimize_target_case_insensitive():
-    assert _parse_optimize_target("cost") == OptimizeTarget.COST
-    assert _parse_optimize_target("time") == OptimizeTarget.TIME
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("COST", OptimizeTarget.COST),
+        ("TIME", OptimizeTarget.TIME),
+        ("cost", OptimizeTarget.COST),
+        ("time", OptimizeTarget.TIME),
+    ],
+)
+def test_parse_optimize_target(value, expected):
+    assert _parse_optimize_target(value) == expected
 
 
 def test_parse_optimize_target_invalid():
@@ -303,15 +612,18 @@ def test_parse_optimize_target_invalid():
 # ---------------------------------------------------------------------------
 
 
-def test_parse_status_refresh_mode_all_values():
-    assert _parse_status_refresh_mode("NONE") == StatusRefreshMode.NONE
-    assert _parse_status_refresh_mode("AUTO") == StatusRefreshMode.AUTO
-    assert _parse_status_refresh_mode("FORCE") == StatusRefreshMode.FORCE
-
-
-def test_parse_status_refresh_mode_case_insensitive():
-    assert _parse_status_refresh_mode("auto") == StatusRefreshMode.AUTO
-    assert _parse_status_refresh_mode("force") == StatusRefreshMode.FORCE
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("NONE", StatusRefreshMode.NONE),
+        ("AUTO", StatusRefreshMode.AUTO),
+        ("FORCE", StatusRefreshMode.FORCE),
+        ("auto", StatusRefreshMode.AUTO),
+        ("force", StatusRefreshMode.FORCE),
+    ],
+)
+def test_parse_status_refresh_mode(value, expected):
+    assert _parse_status_refresh_mode(value) == expected
 
 
 def test_parse_status_refresh_mode_invalid():
@@ -324,12 +636,12 @@ def test_parse_status_refresh_mode_invalid():
 # ---------------------------------------------------------------------------
 
 
-def test_parse_update_mode_rolling():
-    assert _parse_update_mode("rolling") == UpdateMode.ROLLING
-
-
-def test_parse_update_mode_blue_green():
-    assert _parse_update_mode("blue_green") == UpdateMode.BLUE_GREEN
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("rolling", UpdateMode.ROLLING), ("blue_green", UpdateMode.BLUE_GREEN)],
+)
+def test_parse_update_mode(value, expected):
+    assert _parse_update_mode(value) == expected
 
 
 def test_parse_update_mode_invalid():
@@ -337,12 +649,246 @@ def test_parse_update_mode_invalid():
         _parse_update_mode("invalid")
 
 
+def test_parse_wait_for_invalid():
+    with pytest.raises(ValueError, match="Invalid wait_for: 'idle'"):
+        _parse_wait_for("idle")
+
+
+@pytest.mark.parametrize(
+    ("named", "message"),
+    [
+        ({"names": None, "delete_all": False}, "Specify names or delete_all=True."),
+        ({"names": ["a"], "delete_all": True}, "delete_all=True, not both."),
+        (
+            {"name": "j", "job_ids": [1], "pool": None},
+            "exactly one of: name, job_ids, pool (got name, job_ids).",
+        ),
+    ],
+)
+def test_require_exactly_one_errors(named, message):
+    with pytest.raises(ValueError) as exc_info:
+        _require_exactly_one(**named)
+    assert str(exc_info.value).endswith(message)
+
+
+def test_require_exactly_one_accepts_single_argument():
+    _require_exactly_one(names=[], delete_all=True)
+
+
+def test_lazy_module_imports_on_first_access(monkeypatch):
+    import sys
+
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = _LazyModule("colorsys")
+    assert "colorsys" not in sys.modules
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+
+
+async def test_tools_import_sdk_off_the_event_loop(monkeypatch):
+    import importlib
+    import sys
+    import threading
+
+    import_threads = []
+    real_import_module = importlib.import_module
+
+    def import_module(name, *args):
+        if name == "colorsys":
+            import_threads.append(threading.current_thread())
+        return real_import_module(name, *args)
+
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    colorsys = _LazyModule("colorsys")
+    monkeypatch.setattr("skypilot_mcp.helpers.sky", colorsys)
+
+    @handle_skypilot_error
+    async def tool():
+        return colorsys.rgb_to_hsv(1.0, 0.0, 0.0)
+
+    assert await tool() == (0.0, 1.0, 1.0)
+    assert len(import_threads) == 1
+    assert import_threads[0] is not threading.current_thread()
+
+
+# ---------------------------------------------------------------------------
+# capture_stdio
+# ---------------------------------------------------------------------------
+
+
+def test_capture_stdio_captures_stdout_and_stderr():
+    import io
+    import sys
+
+    with capture_stdio(io.StringIO()) as buf:
+        print("out")
+        print("err", file=sys.stderr)
+    assert buf.getvalue() == "out\nerr\n"
+
+
+def test_capture_stdio_is_isolated_per_thread():
+    import io
+    import threading
+
+    barrier = threading.Barrier(4)
+    results = {}
+
+    def worker(n):
+        with capture_stdio(io.StringIO()) as buf:
+            barrier.wait()
+            for _ in range(50):
+                print(n)
+        results[n] = buf.getvalue()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for n in range(4):
+        assert results[n] == f"{n}\n" * 50
+
+
+@pytest.mark.parametrize(
+    ("stdout_is_protocol", "expected_out", "expected_err"),
+    [(True, "after\n", "spinner\n"), (False, "spinner\nafter\n", "")],
+    ids=["stdio", "http"],
+)
+def test_capture_stdio_uncaptured_thread_output(
+    capsys, monkeypatch, stdout_is_protocol, expected_out, expected_err
+):
+    """Other threads' stdout only spills to stderr under the stdio transport."""
+    import io
+    import threading
+
+    monkeypatch.setattr("skypilot_mcp.helpers._STDOUT_IS_PROTOCOL", stdout_is_protocol)
+    with capture_stdio(io.StringIO()) as buf:
+        thread = threading.Thread(target=print, args=("spinner",))
+        thread.start()
+        thread.join()
+    print("after")
+    out, err = capsys.readouterr()
+    assert buf.getvalue() == ""
+    assert out == expected_out
+    assert err == expected_err
+
+
+def test_capture_stdio_restores_streams_after_last_capture():
+    import io
+    import sys
+
+    stdout, stderr = sys.stdout, sys.stderr
+    with capture_stdio(io.StringIO()):
+        with capture_stdio(io.StringIO()):
+            assert sys.stdout is not stdout
+        assert sys.stdout is not stdout
+    assert (sys.stdout, sys.stderr) == (stdout, stderr)
+
+
+# ---------------------------------------------------------------------------
+# _tail_bytes
+# ---------------------------------------------------------------------------
+
+
+def test_tail_bytes_within_budget_unchanged():
+    text = "line 1\nline 2\n"
+    assert _tail_bytes(text, 100) is text
+
+
+def test_tail_bytes_keeps_last_whole_lines():
+    text = "".join(f"line {i}\n" for i in range(10))
+    assert _tail_bytes(text, 16) == "...[truncated]\nline 8\nline 9\n"
+
+
+def test_tail_bytes_does_not_split_multibyte_chars():
+    out = _tail_bytes("\u00e9" * 100, 51)
+    assert out == "...[truncated]\n" + "\u00e9" * 25
+
+
+def test_bounded_list_stream_keeps_recent_chunks():
+    buf = _BoundedListStream(10)
+    for i in range(100):
+        buf.write(f"line {i}\n")
+    assert len(buf.parts) == 2
+    assert buf.getvalue() == "line 98\nline 99\n"
+
+
+async def test_tail_provision_logs_truncates(mock_sky, monkeypatch):
+    monkeypatch.setattr("skypilot_mcp.tools.logs.LOG_MAX_BYTES", 12)
+    mock_sky.tail_provision_logs.side_effect = lambda *a, **kw: kw[
+        "output_stream"
+    ].write("old line\nnew line\n")
+
+    assert await skypilot_tail_provision_logs("c1") == "...[truncated]\nnew line\n"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, 512), ("1024", 1024), ("", 512), ("abc", 512), ("0", 512), ("-5", 512)],
+)
+def test_env_positive_int(monkeypatch, caplog, value, expected):
+    if value is None:
+        monkeypatch.delenv("SKYMCP_TEST_INT", raising=False)
+    else:
+        monkeypatch.setenv("SKYMCP_TEST_INT", value)
+    assert _env_positive_int("SKYMCP_TEST_INT", 512) == expected
+    # Only a value that was set but rejected is reported.
+    warned = value is not None and expected == 512
+    assert ("SKYMCP_TEST_INT" in caplog.text) == warned
+
+
+# ---------------------------------------------------------------------------
+# capture_api_server_logs / _tail_file
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("content", ["a\nb\nc\n", "a\nb\nc", "\n\n"])
+@pytest.mark.parametrize("lines", [None, 0, 2, 5, -2])
+def test_tail_file_matches_tail(tmp_path, content, lines):
+    import subprocess
+
+    path = tmp_path / "log"
+    path.write_text(content)
+    n = "+1" if lines is None else str(lines)
+    expected = subprocess.run(
+        ["tail", "-n", n, str(path)], capture_output=True, text=True, check=True
+    ).stdout
+    assert _tail_file(str(path), lines, block_size=3) == expected
+
+
+def test_capture_api_server_logs_local_reads_file(mock_sky, monkeypatch, tmp_path):
+    from sky.skylet import constants
+
+    monkeypatch.setenv(constants.SKY_RUNTIME_DIR_ENV_VAR_KEY, str(tmp_path))
+    monkeypatch.setattr("sky.server.common.is_api_server_local", lambda: True)
+    log = tmp_path / ".sky" / "api_server" / "server.log"
+    log.parent.mkdir(parents=True)
+    log.write_text("".join(f"line {i}\n" for i in range(10)))
+    assert capture_api_server_logs(tail=2) == "line 8\nline 9\n"
+    mock_sky.api_server_logs.assert_not_called()
+
+
+def test_capture_api_server_logs_remote_streams(mock_sky, monkeypatch):
+    monkeypatch.setattr("sky.server.common.is_api_server_local", lambda: False)
+    mock_sky.stream_and_get.side_effect = lambda **kw: kw["output_stream"].write(
+        "remote\n"
+    )
+    assert capture_api_server_logs(tail=5) == "remote\n"
+    assert mock_sky.stream_and_get.call_args.kwargs["tail"] == 5
+
+
 # ---------------------------------------------------------------------------
 # capture_managed_job_logs
 # ---------------------------------------------------------------------------
 
 
-def test_capture_managed_job_logs_params(mock_sky):
+@pytest.mark.parametrize(
+    ("tail", "expected_tail"),
+    # tail=0 maps to None, the SDK convention for 'all lines'.
+    [(50, 50), (0, None)],
+)
+def test_capture_managed_job_logs_params(mock_sky, tail, expected_tail):
     """Verify controller, refresh, task, tail params are forwarded."""
 
     def mock_tail_logs(**kwargs):
@@ -356,7 +902,7 @@ def test_capture_managed_job_logs_params(mock_sky):
         controller=True,
         refresh=True,
         task="task-0",
-        tail=50,
+        tail=tail,
     )
     assert "log line" in result
     kw = mock_sky.jobs.tail_logs.call_args[1]
@@ -364,22 +910,20 @@ def test_capture_managed_job_logs_params(mock_sky):
     assert kw["refresh"] is True
     assert kw["task"] == "task-0"
     assert kw["follow"] is False
-    assert kw["tail"] == 50
+    assert kw["tail"] == expected_tail
 
 
-def test_capture_managed_job_logs_nonzero_exit(mock_sky):
-    mock_sky.jobs.tail_logs.side_effect = lambda **kw: 1
-    with pytest.raises(RuntimeError, match="Failed to retrieve managed job logs"):
-        capture_managed_job_logs(name="my-job")
-
-
-def test_capture_managed_job_logs_tail_zero_becomes_none(mock_sky):
-    """tail=0 should map to None (SDK convention for 'all lines')."""
-
+def test_capture_managed_job_logs_joins_chunks(mock_sky):
     def mock_tail_logs(**kwargs):
-        kwargs["output_stream"].write("all\n")
+        for i in range(3):
+            print(f"line {i}", file=kwargs["output_stream"], flush=True)
         return 0
 
     mock_sky.jobs.tail_logs.side_effect = mock_tail_logs
-    capture_managed_job_logs(name="my-job", tail=0)
-    assert mock_sky.jobs.tail_logs.call_args[1]["tail"] is None
+    assert capture_managed_job_logs(name="my-job") == "line 0\nline 1\nline 2\n"
+
+
+def test_capture_managed_job_logs_nonzero_exit(mock_sky):
+    mock_sky.jobs.tail_logs.side_effect = lambda **kw: 1
+    with pytest.raises(RuntimeError, match="Failed to retrieve managed job logs"):
+        capture_managed_job_logs(name="my-job")
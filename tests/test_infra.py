@@ -2,8 +2,15 @@
 
 import json
 
+from skypilot_mcp.tools import infra
+from skypilot_mcp.tools.infra import (
+    skypilot_check,
+    skypilot_list_accelerators,
+    skypilot_status_kubernetes,
+)
 
-def test_status_kubernetes_unpacks_4_tuple(mock_sky):
+
+async def test_status_kubernetes_unpacks_4_tuple(mock_sky):
     """When result is a 4-tuple, unpack into structured JSON."""
     mock_sky.get.return_value = (
         [{"name": "cluster-1"}],
@@ -11,32 +18,82 @@ def test_status_kubernetes_unpacks_4_tuple(mock_sky):
         [{"job_id": 1}],
         "default-context",
     )
-    from skypilot_mcp.tools.infra import skypilot_status_kubernetes
 
-    result = json.loads(skypilot_status_kubernetes())
+    result = json.loads(await skypilot_status_kubernetes())
     assert result["context"] == "default-context"
     assert result["clusters"] == [{"name": "cluster-1"}]
     assert result["other_clusters"] == [{"name": "other-1"}]
     assert result["managed_jobs"] == [{"job_id": 1}]
 
 
-def test_status_kubernetes_falls_back_on_unexpected_format(mock_sky):
+async def test_status_kubernetes_falls_back_on_unexpected_format(mock_sky):
     """When result is not a 4-tuple, serialize as-is."""
     mock_sky.get.return_value = {"unexpected": "format"}
-    from skypilot_mcp.tools.infra import skypilot_status_kubernetes
 
-    result = json.loads(skypilot_status_kubernetes())
+    result = json.loads(await skypilot_status_kubernetes())
     assert result["unexpected"] == "format"
 
 
-def test_check_converts_infra_list_to_tuple(mock_sky):
+async def test_status_kubernetes_does_not_unpack_mappings(mock_sky):
+    """A dict with four or more keys is not mistaken for the 4-tuple."""
+    mock_sky.get.return_value = {"a": 1, "b": 2, "c": 3, "d": 4}
+
+    result = json.loads(await skypilot_status_kubernetes())
+    assert result == {"a": 1, "b": 2, "c": 3, "d": 4}
+
+
+async def test_check_converts_infra_list_to_tuple(mock_sky):
     """infra list should be converted to a tuple for the SDK."""
     mock_sky.get.return_value = {"aws": ["us-east-1"]}
-    from skypilot_mcp.tools.infra import skypilot_check
 
-    skypilot_check(infra=["aws", "gcp"])
+    await skypilot_check(infra=["aws", "gcp"])
     mock_sky.check.assert_called_once_with(
         infra_list=("aws", "gcp"),
         verbose=False,
         workspace=None,
     )
+
+
+async def test_list_accelerators_reuses_cached_response(mock_sky):
+    mock_sky.get.return_value = {"A100": []}
+
+    first = await skypilot_list_accelerators(clouds=["aws"])
+    assert await skypilot_list_accelerators(clouds=["aws"]) == first
+    assert mock_sky.list_accelerators.call_count == 1
+
+    # Different arguments and refresh=True both go back to the server.
+    await skypilot_list_accelerators(clouds=["gcp"])
+    await skypilot_list_accelerators(clouds=["aws"], refresh=True)
+    assert mock_sky.list_accelerators.call_count == 3
+
+
+async def test_enabled_clouds_cache_expires(mock_sky, monkeypatch):
+    await infra.skypilot_enabled_clouds()
+    monkeypatch.setattr(infra, "CATALOG_CACHE_TTL", 0)
+    await infra.skypilot_enabled_clouds(expand=True)
+    await infra.skypilot_enabled_clouds(expand=True)
+    assert mock_sky.enabled_clouds.call_count == 3
+
+
+async def test_check_invalidates_cached_enabled_clouds(mock_sky):
+    mock_sky.get.return_value = ["aws"]
+    assert json.loads(await infra.skypilot_enabled_clouds()) == ["aws"]
+
+    await skypilot_check(infra=["gcp"])
+    mock_sky.get.return_value = ["aws", "gcp"]
+    assert json.loads(await infra.skypilot_enabled_clouds()) == ["aws", "gcp"]
+
+
+async def test_catalog_cache_is_keyed_by_api_server(mock_sky):
+    get_server_url = mock_sky.server.common.get_server_url
+    get_server_url.return_value = "http://server-a"
+    mock_sky.get.return_value = ["aws"]
+    await infra.skypilot_enabled_clouds()
+
+    get_server_url.return_value = "http://server-b"
+    mock_sky.get.return_value = ["gcp"]
+    assert json.loads(await infra.skypilot_enabled_clouds()) == ["gcp"]
+
+    get_server_url.return_value = "http://server-a"
+    assert json.loads(await infra.skypilot_enabled_clouds()) == ["aws"]
+    assert mock_sky.enabled_clouds.call_count == 2
@@ -5,28 +5,29 @@ import json
 import pytest
 from fastmcp.exceptions import ToolError
 
+from skypilot_mcp.tools.managed_jobs import (
+    skypilot_managed_job_cancel,
+    skypilot_managed_job_logs,
+    skypilot_managed_job_queue,
+)
 
 # -- Cancel: mutual exclusivity -------------------------------------------
 
 
-def test_cancel_rejects_multiple_specifiers(mock_sky):
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_cancel
-
+async def test_cancel_rejects_multiple_specifiers(mock_sky):
     with pytest.raises(ToolError, match="Specify exactly one of"):
-        skypilot_managed_job_cancel(name="j", job_ids=[1])
-
+        await skypilot_managed_job_cancel(name="j", job_ids=[1])
 
-def test_cancel_rejects_no_specifier(mock_sky):
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_cancel
 
+async def test_cancel_rejects_no_specifier(mock_sky):
     with pytest.raises(ToolError, match="Specify exactly one of"):
-        skypilot_managed_job_cancel()
+        await skypilot_managed_job_cancel()
 
 
 # -- Queue v2: defensive tuple unpacking -----------------------------------
 
 
-def test_queue_v2_unpacks_4_tuple(mock_sky):
+async def test_queue_v2_unpacks_4_tuple(mock_sky):
     """When result is a 4-tuple, unpack into structured JSON."""
     mock_sky.get.return_value = (
         [{"job_id": 1}],  # records
@@ -34,46 +35,50 @@ def test_queue_v2_unpacks_4_tuple(mock_sky):
         {"RUNNING": 1},  # status_counts
         1,  # filtered_count
     )
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_queue
 
-    result = json.loads(skypilot_managed_job_queue(refresh=False))
+    result = json.loads(await skypilot_managed_job_queue(refresh=False))
     assert result["total_count"] == 1
     assert result["jobs"] == [{"job_id": 1}]
     assert result["status_counts"] == {"RUNNING": 1}
 
 
-def test_queue_v2_falls_back_on_unexpected_format(mock_sky):
+async def test_queue_v2_falls_back_on_unexpected_format(mock_sky):
     """When result is not a 4-tuple, serialize as-is."""
     mock_sky.get.return_value = {"unexpected": "format"}
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_queue
 
-    result = json.loads(skypilot_managed_job_queue(refresh=False))
+    result = json.loads(await skypilot_managed_job_queue(refresh=False))
     assert result["unexpected"] == "format"
 
 
+async def test_queue_v2_short_sequence_serialized_as_is(mock_sky):
+    """A list with fewer than four items is not unpacked."""
+    mock_sky.get.return_value = [{"job_id": 1}, {"job_id": 2}]
+
+    result = json.loads(await skypilot_managed_job_queue(refresh=False))
+    assert result == [{"job_id": 1}, {"job_id": 2}]
+
+
 # -- Logs: stream capture and controller/task params -----------------------
 
 
-def test_logs_captures_output(mock_sky):
+async def test_logs_captures_output(mock_sky):
     def fake_tail(**kw):
         kw["output_stream"].write("log line\n")
         return 0
 
     mock_sky.jobs.tail_logs.side_effect = fake_tail
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_logs
 
-    assert "log line" in skypilot_managed_job_logs(name="j")
+    assert "log line" in await skypilot_managed_job_logs(name="j")
 
 
-def test_logs_passes_controller_and_task(mock_sky):
+async def test_logs_passes_controller_and_task(mock_sky):
     def fake_tail(**kw):
         kw["output_stream"].write("ok\n")
         return 0
 
     mock_sky.jobs.tail_logs.side_effect = fake_tail
-    from skypilot_mcp.tools.managed_jobs import skypilot_managed_job_logs
 
-    skypilot_managed_job_logs(name="j", controller=True, task=2)
+    await skypilot_managed_job_logs(name="j", controller=True, task=2)
     kw = mock_sky.jobs.tail_logs.call_args[1]
     assert kw["controller"] is True
     assert kw["task"] == 2
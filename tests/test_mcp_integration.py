@@ -5,6 +5,7 @@ protocol, verifying tool registration, schema correctness, JSON responses,
 and error handling — things the previous mock-heavy tests never covered.
 """
 
+import asyncio
 import json
 
 import pytest
@@ -38,6 +39,7 @@ EXPECTED_TOOLS = {
     "skypilot_cluster_down",
     "skypilot_cluster_autostop",
     "skypilot_cluster_endpoints",
+    "skypilot_overview",
     # Config
     "skypilot_reload_config",
     "skypilot_workspaces",
@@ -111,23 +113,22 @@ async def client(mock_sky):
         yield c
 
 
-# -- Tool discovery --------------------------------------------------------
+@pytest.fixture
+async def tools_by_name(client):
+    """The tools listed over MCP, keyed by name."""
+    return {t.name: t for t in await client.list_tools()}
 
 
-async def test_all_tools_registered(client):
-    """Every expected tool should be discoverable via the MCP protocol."""
-    tools = await client.list_tools()
-    registered = {t.name for t in tools}
-    missing = EXPECTED_TOOLS - registered
-    assert not missing, f"Tools not registered: {missing}"
+# -- Tool discovery --------------------------------------------------------
 
 
-async def test_no_unexpected_tools(client):
-    """No tools beyond the expected set should be registered."""
-    tools = await client.list_tools()
-    registered = {t.name for t in tools}
-    extra = registered - EXPECTED_TOOLS
-    assert not extra, f"Unexpected tools registered: {extra}"
+async def test_registered_tools_match_expected(client):
+    """Exactly the expected tools should be discoverable via the MCP protocol."""
+    registered = {t.name for t in await client.list_tools()}
+    assert registered == EXPECTED_TOOLS, (
+        f"Tools not registered: {EXPECTED_TOOLS - registered}; "
+        f"unexpected tools registered: {registered - EXPECTED_TOOLS}"
+    )
 
 
 async def test_tools_have_descriptions(client):
@@ -204,43 +205,127 @@ async def test_call_with_stream_capture(client, mock_sky):
     assert parsed["result"]["status"] == "SUCCEEDED"
 
 
-# -- Tool annotations / tags ----------------------------------------------
+async def test_results_sent_once_as_text(client, mock_sky):
+    """String results should not be duplicated as structured content."""
+    mock_sky.get.return_value = [{"name": "test-cluster"}]
+    result = await client.call_tool("skypilot_cluster_status", {})
+    assert result.structured_content is None
+    assert json.loads(result.content[0].text) == [{"name": "test-cluster"}]
+    tools = await client.list_tools()
+    assert all(t.output_schema is None for t in tools)
 
 
-async def test_read_only_tools_annotated(client):
-    """Read-only tools should be annotated with readOnlyHint=True."""
-    tools = await client.list_tools()
-    tools_by_name = {t.name: t for t in tools}
+async def test_concurrent_tool_calls(client, mock_sky):
+    """Tool calls in flight at once on one session each get their own result."""
+    mock_sky.get.return_value = [{"name": "test-cluster"}]
+
+    def mock_stream(request_id, **kwargs):
+        print(f"logs for {request_id}", file=kwargs["output_stream"], flush=True)
+        return request_id
 
-    read_only_tools = [
+    mock_sky.stream_and_get.side_effect = mock_stream
+
+    results = await asyncio.gather(
+        client.call_tool("skypilot_api_info", {}),
+        client.call_tool("skypilot_cluster_status", {}),
+        client.call_tool("skypilot_cluster_stop", {"cluster_name": "c"}),
+        client.call_tool("skypilot_stream_and_get", {"request_id": "req-a"}),
+        client.call_tool("skypilot_stream_and_get", {"request_id": "req-b"}),
+    )
+    info, status, stop, stream_a, stream_b = (
+        json.loads(r.content[0].text) for r in results
+    )
+    assert info["status"] == "healthy"
+    assert status == [{"name": "test-cluster"}]
+    assert stop["request_id"] == "req-stop-001"
+    assert stream_a == {"result": "req-a", "logs": "logs for req-a\n"}
+    assert stream_b == {"result": "req-b", "logs": "logs for req-b\n"}
+
+
+# -- Tool annotations / tags ----------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
         "skypilot_api_info",
         "skypilot_cluster_status",
         "skypilot_cluster_endpoints",
         "skypilot_job_queue",
         "skypilot_serve_status",
-    ]
-    for name in read_only_tools:
-        tool = tools_by_name[name]
-        annotations = tool.annotations
-        assert annotations is not None, f"{name} missing annotations"
-        assert annotations.readOnlyHint is True, f"{name} should be readOnlyHint=True"
-
+    ],
+)
+async def test_read_only_tools_annotated(tools_by_name, name):
+    """Read-only tools should be annotated with readOnlyHint=True."""
+    annotations = tools_by_name[name].annotations
+    assert annotations is not None, f"{name} missing annotations"
+    assert annotations.readOnlyHint is True, f"{name} should be readOnlyHint=True"
 
-async def test_destructive_tools_annotated(client):
-    """Destructive tools should be annotated with destructiveHint=True."""
-    tools = await client.list_tools()
-    tools_by_name = {t.name: t for t in tools}
 
-    destructive_tools = [
+@pytest.mark.parametrize(
+    "name",
+    [
         "skypilot_cluster_stop",
         "skypilot_cluster_down",
         "skypilot_serve_down",
         "skypilot_job_cancel",
-    ]
-    for name in destructive_tools:
-        tool = tools_by_name[name]
-        annotations = tool.annotations
-        assert annotations is not None, f"{name} missing annotations"
-        assert annotations.destructiveHint is True, (
-            f"{name} should be destructiveHint=True"
-        )
+    ],
+)
+async def test_destructive_tools_annotated(tools_by_name, name):
+    """Destructive tools should be annotated with destructiveHint=True."""
+    annotations = tools_by_name[name].annotations
+    assert annotations is not None, f"{name} missing annotations"
+    assert annotations.destructiveHint is True, f"{name} should be destructiveHint=True"
+
+
+async def test_stream_and_get_reports_log_progress(client, mock_sky):
+    """Log lines should reach the client as progress notifications."""
+
+    def fake_stream_and_get(request_id, **kwargs):
+        for i in range(3):
+            print(f"line {i}", file=kwargs["output_stream"], flush=True)
+        return "done"
+
+    mock_sky.stream_and_get.side_effect = fake_stream_and_get
+    messages = []
+
+    async def on_progress(progress, total, message):
+        messages.append(message)
+
+    result = await client.call_tool(
+        "skypilot_stream_and_get",
+        {"request_id": "req-1"},
+        progress_handler=on_progress,
+    )
+    parsed = json.loads(result.content[0].text)
+    assert parsed == {"result": "done", "logs": "line 0\nline 1\nline 2\n"}
+    assert "\n".join(messages) == "line 0\nline 1\nline 2"
+
+
+async def test_stream_and_get_throttles_progress(client, mock_sky, monkeypatch):
+    """Lines logged within the progress interval share one notification."""
+    monkeypatch.setattr("skypilot_mcp.tools.api_server.PROGRESS_MIN_INTERVAL", 60)
+
+    def fake_stream_and_get(request_id, **kwargs):
+        for i in range(100):
+            print(f"line {i}", file=kwargs["output_stream"])
+        return "done"
+
+    mock_sky.stream_and_get.side_effect = fake_stream_and_get
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, message))
+
+    await client.call_tool(
+        "skypilot_stream_and_get",
+        {"request_id": "req-1"},
+        progress_handler=on_progress,
+    )
+    # The first flush goes out at once; the rest waits for the interval and
+    # is sent when the request finishes.
+    assert len(updates) <= 2
+    assert updates[-1][0] == 100
+    assert "\n".join(m for _, m in updates) == "\n".join(
+        f"line {i}" for i in range(100)
+    )